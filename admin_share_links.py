@@ -118,6 +118,25 @@ def validate_share_link(token, tournament_id):
     finally:
         conn.close()
 
+def validate_share_link_once(token, tournament_id):
+    """Validate a share link at most once per request.
+    
+    Results are memoized on g, so a token checked by a decorator and again
+    by the view costs a single lookup and counts as a single use.
+    
+    Args:
+        token: The share token to validate
+        tournament_id: The tournament ID to validate against
+        
+    Returns:
+        tuple: (is_valid, permissions) as returned by validate_share_link
+    """
+    cache = g.setdefault('share_link_cache', {})
+    key = (token, str(tournament_id))
+    if key not in cache:
+        cache[key] = validate_share_link(token, tournament_id)
+    return cache[key]
+
 def get_share_links(tournament_id, user_id):
     """Get all share links for a tournament (only for tournament creator)."""
     conn = get_db_connection()
@@ -215,7 +234,7 @@ def share_link_required(permission=None):
             share_link_key = f'share_link_{tournament_id}'
             if share_link_key in session:
                 token = session[share_link_key]
-                is_valid, permissions = validate_share_link(token, tournament_id)
+                is_valid, permissions = validate_share_link_once(token, tournament_id)
                 if is_valid:
                     # Store permissions in g for use in templates
                     g.share_link_permissions = permissions
@@ -229,7 +248,7 @@ def share_link_required(permission=None):
             # If no valid session, check for token in query params
             token = request.args.get('token')
             if token:
-                is_valid, permissions = validate_share_link(token, tournament_id)
+                is_valid, permissions = validate_share_link_once(token, tournament_id)
                 if is_valid:
                     # Store the token in session for future requests
                     session[share_link_key] = token
@@ -16,6 +16,20 @@ import simplejson as json
 import secrets
 from markupsafe import Markup
 import re
+import atexit
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from flask.logging import default_handler
+from dotenv import load_dotenv
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; Flask's stdlib provider is used without it
+    orjson = None
+
+# Load environment variables
+load_dotenv()
 
 # Custom JSON provider
 class CustomJSONProvider:
@@ -29,8 +43,28 @@ class CustomJSONProvider:
     def loads(self, s, **kwargs):
         return json.loads(s, **kwargs)
 
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that serializes jsonify payloads with orjson.
+
+    Datetimes are passed through to Flask's default hook so responses keep
+    the same format as the stdlib provider.
+    """
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=kwargs.get('default', self.default), option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 # Create Flask app
 app = Flask(__name__)
+if orjson is not None:
+    app.json = OrjsonProvider(app)
 
 # Helper function to return JSON responses
 def json_response(data, status=200):
@@ -55,6 +89,14 @@ app.config['WTF_CSRF_ENABLED'] = True
 app.config['WTF_CSRF_SECRET_KEY'] = 'your-csrf-secret-key-123'  # Fixed key for development
 app.config['WTF_CSRF_TIME_LIMIT'] = 3600  # 1 hour
 
+# Hand log records to a background thread so request threads never block on log I/O
+log_queue = queue.SimpleQueue()
+app.logger.removeHandler(default_handler)
+app.logger.addHandler(QueueHandler(log_queue))
+log_listener = QueueListener(log_queue, default_handler, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)
+
 # Initialize session
 Session(app)
 
@@ -16,9 +16,8 @@ def tournament_creator_required(f):
     """Decorator to ensure user is the creator of the tournament."""
     @wraps(f)
     def decorated_function(tournament_id, *args, **kwargs):
-        from tournament_routes import get_db
-        db = get_db()
-        tournament = db.get_tournament(tournament_id)
+        from tournament_routes import cached_tournament
+        tournament = cached_tournament(tournament_id)
         
         if not tournament:
             flash('Tournament not found.', 'danger')
@@ -35,9 +34,8 @@ def check_tournament_active(f):
     """Decorator to check if a tournament is active (not completed)."""
     @wraps(f)
     def decorated_function(tournament_id, *args, **kwargs):
-        from tournament_routes import get_db
-        db = get_db()
-        tournament = db.get_tournament(tournament_id)
+        from tournament_routes import cached_tournament
+        tournament = cached_tournament(tournament_id)
         
         if tournament and tournament.get('status') == 'completed':
             flash('This tournament has been concluded and can no longer be modified.', 'warning')
@@ -12,42 +12,51 @@ def get_db_schema(db_path):
         conn.text_factory = lambda x: str(x, 'utf-8', 'replace')
         cursor = conn.cursor()
         
-        # Get list of tables
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-        tables = [row[0] for row in cursor.fetchall()]
+        # Get list of tables, skipping sqlite_ system tables
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%';")
+        for (table,) in cursor.fetchall():
+            schema[table] = {'columns': [], 'foreign_keys': [], 'indexes': []}
         
-        # Get schema for each table
-        for table in tables:
-            # Skip sqlite_ system tables
-            if table.startswith('sqlite_'):
+        # Fetch columns, foreign keys and indexes for every table at once through
+        # the pragma table-valued functions instead of one PRAGMA per table
+        cursor.execute("""
+            SELECT m.name, p.cid, p.name, p.type, p."notnull", p.dflt_value, p.pk
+            FROM sqlite_master m JOIN pragma_table_info(m.name) p
+            WHERE m.type = 'table'
+            ORDER BY m.name, p.cid;
+        """)
+        for table, *column in cursor.fetchall():
+            if table in schema:
+                schema[table]['columns'].append(tuple(column))
+        
+        cursor.execute("""
+            SELECT m.name, f.id, f.seq, f."table", f."from", f."to", f.on_update, f.on_delete, f."match"
+            FROM sqlite_master m JOIN pragma_foreign_key_list(m.name) f
+            WHERE m.type = 'table'
+            ORDER BY m.name, f.id, f.seq;
+        """)
+        for table, *foreign_key in cursor.fetchall():
+            if table in schema:
+                schema[table]['foreign_keys'].append(tuple(foreign_key))
+        
+        cursor.execute("""
+            SELECT m.name, il.name, il."unique", ii.seqno, ii.name
+            FROM sqlite_master m
+            JOIN pragma_index_list(m.name) il
+            LEFT JOIN pragma_index_info(il.name) ii
+            WHERE m.type = 'table'
+            ORDER BY m.name, il.seq, ii.seqno;
+        """)
+        indexes = {}
+        for table, idx_name, unique, seqno, column in cursor.fetchall():
+            if table not in schema:
                 continue
-                
-            # Get table info
-            cursor.execute(f"PRAGMA table_info({table});")
-            columns = cursor.fetchall()
-            
-            # Get foreign key info
-            cursor.execute(f"PRAGMA foreign_key_list({table});")
-            foreign_keys = cursor.fetchall()
-            
-            # Get indexes
-            cursor.execute(f"PRAGMA index_list({table});")
-            indexes = []
-            for idx in cursor.fetchall():
-                idx_name = idx[1]
-                cursor.execute(f"PRAGMA index_info({idx_name});")
-                idx_columns = [row[2] for row in cursor.fetchall()]
-                indexes.append({
-                    'name': idx_name,
-                    'unique': idx[2] == 1,
-                    'columns': idx_columns
-                })
-            
-            schema[table] = {
-                'columns': columns,
-                'foreign_keys': foreign_keys,
-                'indexes': indexes
-            }
+            index = indexes.get((table, idx_name))
+            if index is None:
+                index = indexes[(table, idx_name)] = {'name': idx_name, 'unique': unique == 1, 'columns': []}
+                schema[table]['indexes'].append(index)
+            if seqno is not None:
+                index['columns'].append(column)
         
         return schema
     except Exception as e:
@@ -31,13 +31,12 @@ def add_share_token():
                 ADD COLUMN share_token TEXT;
             """)
             
-            # Generate tokens for existing tournaments
+            # Generate tokens for existing tournaments in one batch
             cursor.execute("SELECT id FROM tournaments")
-            for (tournament_id,) in cursor.fetchall():
-                cursor.execute(
-                    "UPDATE tournaments SET share_token = ? WHERE id = ?",
-                    (secrets.token_urlsafe(16), tournament_id)
-                )
+            cursor.executemany(
+                "UPDATE tournaments SET share_token = ? WHERE id = ?",
+                [(secrets.token_urlsafe(16), tournament_id) for (tournament_id,) in cursor.fetchall()]
+            )
             
             # Now add the UNIQUE constraint
             try:
@@ -0,0 +1,73 @@
+import os
+import sys
+
+import pytest
+from flask import Flask, g
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tournament_routes
+from tournament_db import TournamentDB
+from tournament_routes import tournament_bp
+
+ROUNDS = 3
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """A scratch database with one tournament of five players and three paired rounds."""
+    path = str(tmp_path / 'tournament.db')
+    db = TournamentDB(path)
+    # Added to existing databases by migrations/add_team_to_players.py
+    db.cursor.execute("ALTER TABLE players ADD COLUMN team TEXT")
+    db.cursor.execute("""
+        INSERT INTO tournaments (name, start_date, end_date, rounds, created_at, creator_id)
+        VALUES ('Export Open', '2025-01-01', '2025-01-02', 5, datetime('now'), 1)
+    """)
+    tournament_id = db.cursor.lastrowid
+    player_ids = []
+    for name in ('Ann', 'Ben', 'Cai', 'Dev', 'Eve'):
+        db.cursor.execute(
+            "INSERT INTO players (name, rating, created_at) VALUES (?, 1500, datetime('now'))", (name,)
+        )
+        player_ids.append(db.cursor.lastrowid)
+    db.cursor.executemany(
+        "INSERT INTO tournament_players (tournament_id, player_id, initial_rating) VALUES (?, ?, 1500)",
+        [(tournament_id, player_id) for player_id in player_ids]
+    )
+    for round_number in range(1, ROUNDS + 1):
+        db.cursor.execute(
+            "INSERT INTO rounds (tournament_id, round_number) VALUES (?, ?)", (tournament_id, round_number)
+        )
+        round_id = db.cursor.lastrowid
+        db.cursor.executemany(
+            "INSERT INTO pairings (round_id, white_player_id, black_player_id, board_number, result) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [(round_id, player_ids[0], player_ids[1], 1, '1-0'),
+             (round_id, player_ids[2], player_ids[3], 2, None),
+             (round_id, player_ids[4], None, 3, '1-0')]
+        )
+    db.conn.commit()
+    db.close()
+    return path
+
+
+@pytest.fixture
+def client(db_path, monkeypatch):
+    """A test client for the tournament blueprint backed by the scratch database."""
+    def get_db():
+        if 'db' not in g:
+            g.db = TournamentDB(db_path)
+        return g.db
+
+    monkeypatch.setattr(tournament_routes, 'get_db', get_db)
+
+    app = Flask(__name__)
+    app.secret_key = 'test'
+    app.config['WTF_CSRF_ENABLED'] = False
+    app.register_blueprint(tournament_bp, url_prefix='/tournament')
+    client = app.test_client()
+    with client.session_transaction() as session:
+        session['user_id'] = 1
+    client.tournament_id = 1
+    return client
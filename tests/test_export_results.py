@@ -0,0 +1,25 @@
+import csv
+import io
+
+import tournament_routes
+from conftest import ROUNDS
+
+
+def test_streamed_csv_export_is_complete(client, monkeypatch):
+    # Small chunks so the export is read back over several yields
+    monkeypatch.setattr(tournament_routes, 'CSV_CHUNK_ROWS', 2)
+
+    response = client.get(f'/tournament/{client.tournament_id}/export-results', buffered=False)
+
+    assert response.status_code == 200
+    assert response.mimetype == 'text/csv'
+    try:
+        body = b''.join(response.iter_encoded()).decode('utf-8')
+    finally:
+        response.close()
+    rows = list(csv.reader(io.StringIO(body)))
+    assert rows[0] == ['Round', 'Board', 'White Player', 'Black Player', 'Result']
+    assert len(rows) == 1 + ROUNDS * 3
+    assert rows[1] == ['1', '1', 'Ann', 'Ben', '1-0']
+    assert rows[2] == ['1', '2', 'Cai', 'Dev', '']
+    assert rows[-1] == [str(ROUNDS), '3', 'Eve', 'BYE', '1-0']
@@ -0,0 +1,35 @@
+import io
+
+from tournament_db import TournamentDB
+
+
+def _import(client, csv_text):
+    """Upload a players CSV and return the messages it flashed."""
+    response = client.post(
+        f'/tournament/{client.tournament_id}/import',
+        data={'file': (io.BytesIO(csv_text.encode()), 'players.csv')},
+        content_type='multipart/form-data'
+    )
+    assert response.status_code == 302
+    with client.session_transaction() as session:
+        return [message for _, message in session.pop('_flashes', [])]
+
+
+def _ratings(db_path, names):
+    db = TournamentDB(db_path)
+    placeholders = ','.join('?' * len(names))
+    db.cursor.execute(f"SELECT name, rating FROM players WHERE name IN ({placeholders})", names)
+    ratings = {row['name']: row['rating'] for row in db.cursor.fetchall()}
+    db.close()
+    return ratings
+
+
+def test_fractional_rating_is_rejected(client, db_path):
+    messages = _import(client, 'name,rating\nFay,1500.7\nGus,1600.0\nHal,abc\nIda,\n')
+
+    assert messages == [
+        'Successfully imported 2 players!',
+        'Some players could not be imported. '
+        'Error in row 2: invalid rating Error in row 4: invalid rating'
+    ]
+    assert _ratings(db_path, ['Fay', 'Gus', 'Hal', 'Ida']) == {'Gus': 1600, 'Ida': 1200}
@@ -0,0 +1,33 @@
+from tournament_db import TournamentDB
+
+ALREADY_GENERATED = 'Pairings for this round have already been generated.'
+
+
+def _generate(client, method):
+    """Post the pairings form and return the messages it flashed."""
+    response = client.post(f'/tournament/{client.tournament_id}/pairings', data={'pairing_method': method})
+    assert response.status_code == 302
+    with client.session_transaction() as session:
+        return [message for _, message in session.pop('_flashes', [])]
+
+
+def test_switching_method_back_regenerates(client):
+    assert _generate(client, 'swiss') == ['Pairings generated successfully using swiss method!']
+    assert _generate(client, 'round_robin') == ['Pairings generated successfully using round_robin method!']
+    assert _generate(client, 'swiss') == ['Pairings generated successfully using swiss method!']
+    assert _generate(client, 'swiss') == [ALREADY_GENERATED]
+
+
+def test_log_keeps_only_the_latest_generation(db_path):
+    db = TournamentDB(db_path)
+    round_id = db.get_current_round(1)['id']
+    signature = db.get_pairing_signature(1, 3)
+
+    for method in ('swiss', 'random', 'swiss'):
+        assert db.log_pairing_generation(round_id, method, signature)
+        assert db.pairings_already_generated(round_id, method, signature)
+    assert not db.pairings_already_generated(round_id, 'random', signature)
+
+    assert db.clear_pairing_generation(round_id)
+    assert not db.pairings_already_generated(round_id, 'swiss', signature)
+    db.close()
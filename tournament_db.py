@@ -1,7 +1,33 @@
 import sqlite3
 import os
+import json
+import hashlib
 from datetime import datetime
-from typing import Optional, Dict, Any, List, Union, Tuple
+from typing import Optional, Dict, Any, Iterator, List, Union, Tuple
+
+# Per-round pairing completion for a tournament. Kept as fixed strings so every
+# call hits sqlite3's prepared statement cache.
+_ROUND_COMPLETION_CTE = """
+    WITH rstats AS (
+        SELECT r.id, r.round_number,
+               COALESCE(rc.total, 0) as total_pairings,
+               COALESCE(rc.completed, 0) as completed_pairings
+        FROM rounds r
+        LEFT JOIN round_completion rc ON rc.round_id = r.id
+        WHERE r.tournament_id = ?
+    ), ranked AS (
+        SELECT rstats.*,
+               total_pairings > 0 AND completed_pairings = total_pairings as is_completed,
+               round_number = MAX(round_number) OVER () as is_current
+        FROM rstats
+    )
+"""
+ROUND_COMPLETION_SQL = _ROUND_COMPLETION_CTE + "SELECT * FROM ranked ORDER BY round_number"
+ROUND_COMPLETION_ONE_SQL = _ROUND_COMPLETION_CTE + "SELECT * FROM ranked WHERE round_number = ?"
+
+# Stored in PRAGMA user_version once _migrate_schema has run cleanly. Bump it
+# whenever the schema setup changes so existing databases pick the change up.
+SCHEMA_VERSION = 2
 
 class TournamentDB:
     def __init__(self, db_path: str = 'tournament.db'):
@@ -12,13 +38,42 @@ class TournamentDB:
 
     def _initialize_db(self):
         """Initialize the database with required tables if they don't exist."""
-        self.conn = sqlite3.connect(self.db_path)
+        self.conn = sqlite3.connect(self.db_path, cached_statements=256)
         self.conn.row_factory = sqlite3.Row
         self.cursor = self.conn.cursor()
         
         # Enable foreign key constraints
         self.cursor.execute("PRAGMA foreign_keys = ON")
         
+        # WAL lets readers run alongside a writer and, with synchronous=NORMAL,
+        # avoids an fsync on every commit
+        self.cursor.execute("PRAGMA main.journal_mode = WAL")
+        self.cursor.execute("PRAGMA synchronous = NORMAL")
+        
+        # Wait for a competing writer instead of failing with "database is locked",
+        # and keep up to 64 MiB of pages cached per connection
+        self.cursor.execute("PRAGMA busy_timeout = 5000")
+        self.cursor.execute("PRAGMA cache_size = -65536")
+        
+        # Attach the users database so creator details can be joined in
+        users_db_path = os.path.join(os.path.dirname(os.path.abspath(self.db_path)), 'users.db')
+        self.users_attached = os.path.exists(users_db_path)
+        if self.users_attached:
+            self.cursor.execute("ATTACH DATABASE ? AS udb", (users_db_path,))
+        
+        # The schema only needs checking once per database file
+        self.cursor.execute("PRAGMA user_version")
+        if self.cursor.fetchone()[0] < SCHEMA_VERSION:
+            self._migrate_schema()
+        
+    def _migrate_schema(self):
+        """Create missing tables, indexes and triggers, then record SCHEMA_VERSION.
+        
+        The version is only written if every step succeeded, so a failed step
+        is retried by the next connection.
+        """
+        schema_ok = True
+        
         # Create tables if they don't exist
         self.cursor.executescript("""
         CREATE TABLE IF NOT EXISTS users (
@@ -100,14 +155,31 @@ class TournamentDB:
             UNIQUE(tournament_id, player_id, round_number)
         );
         
+        CREATE TABLE IF NOT EXISTS pairing_generation_log (
+            round_id INTEGER PRIMARY KEY,
+            method TEXT NOT NULL,
+            byes_signature TEXT NOT NULL,
+            generated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (round_id) REFERENCES rounds(id) ON DELETE CASCADE
+        );
+        
         CREATE INDEX IF NOT EXISTS idx_tournament_players_tournament ON tournament_players(tournament_id);
         CREATE INDEX IF NOT EXISTS idx_tournament_players_player ON tournament_players(player_id);
         CREATE INDEX IF NOT EXISTS idx_rounds_tournament ON rounds(tournament_id);
         CREATE INDEX IF NOT EXISTS idx_pairings_round ON pairings(round_id);
         CREATE INDEX IF NOT EXISTS idx_manual_byes_tournament ON manual_byes(tournament_id);
         CREATE INDEX IF NOT EXISTS idx_manual_byes_player ON manual_byes(player_id);
+        CREATE INDEX IF NOT EXISTS idx_pairings_round_result ON pairings(round_id, result);
+        CREATE INDEX IF NOT EXISTS idx_manual_byes_round ON manual_byes(tournament_id, round_number, player_id);
+        CREATE INDEX IF NOT EXISTS idx_pairings_incomplete ON pairings(round_id) WHERE result IS NULL OR result = '';
+        CREATE INDEX IF NOT EXISTS idx_rounds_tid_status ON rounds(tournament_id, status);
         """)
         
+        # Gather planner statistics once so the composite indexes get picked up
+        self.cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'")
+        if not self.cursor.fetchone():
+            self.cursor.execute("ANALYZE")
+        
         # Add requested_bye_round column if it doesn't exist
         try:
             # First, check if the column exists
@@ -123,9 +195,263 @@ class TournamentDB:
                 """)
                 self.conn.commit()
         except sqlite3.Error as e:
+            schema_ok = False
             print(f"Warning: Could not check/add requested_bye_round column: {e}")
             # Continue execution even if there's an error
         
+        # The generation log keeps only the latest generation of each round;
+        # older databases keyed it on (round_id, method, byes_signature)
+        try:
+            self.cursor.execute("""
+                SELECT COUNT(*) FROM pragma_table_info('pairing_generation_log')
+                WHERE name != 'round_id' AND pk > 0
+            """)
+            if self.cursor.fetchone()[0]:
+                self.cursor.executescript("""
+                BEGIN;
+                
+                DROP TABLE pairing_generation_log;
+                
+                CREATE TABLE pairing_generation_log (
+                    round_id INTEGER PRIMARY KEY,
+                    method TEXT NOT NULL,
+                    byes_signature TEXT NOT NULL,
+                    generated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (round_id) REFERENCES rounds(id) ON DELETE CASCADE
+                );
+                
+                COMMIT;
+                """)
+        except sqlite3.Error as e:
+            schema_ok = False
+            print(f"Warning: Could not rebuild pairing_generation_log table: {e}")
+            if self.conn.in_transaction:
+                self.conn.rollback()
+        
+        # Per-round pairing counts, kept up to date by triggers so completion
+        # checks don't have to aggregate pairings on every request
+        try:
+            self.cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'round_completion'"
+            )
+            if not self.cursor.fetchone():
+                self.cursor.executescript("""
+                BEGIN;
+                
+                CREATE TABLE IF NOT EXISTS round_completion (
+                    round_id INTEGER PRIMARY KEY,
+                    total INTEGER NOT NULL DEFAULT 0,
+                    completed INTEGER NOT NULL DEFAULT 0,
+                    FOREIGN KEY (round_id) REFERENCES rounds(id) ON DELETE CASCADE
+                );
+                
+                INSERT OR IGNORE INTO round_completion (round_id, total, completed)
+                SELECT r.id, COUNT(p.id),
+                       COALESCE(SUM(p.result IS NOT NULL AND p.result != ''), 0)
+                FROM rounds r
+                LEFT JOIN pairings p ON p.round_id = r.id
+                GROUP BY r.id;
+                
+                CREATE TRIGGER IF NOT EXISTS trg_round_completion_round_insert
+                AFTER INSERT ON rounds
+                BEGIN
+                    INSERT OR IGNORE INTO round_completion (round_id) VALUES (NEW.id);
+                END;
+                
+                CREATE TRIGGER IF NOT EXISTS trg_round_completion_round_delete
+                AFTER DELETE ON rounds
+                BEGIN
+                    DELETE FROM round_completion WHERE round_id = OLD.id;
+                END;
+                
+                CREATE TRIGGER IF NOT EXISTS trg_round_completion_pairing_insert
+                AFTER INSERT ON pairings
+                BEGIN
+                    UPDATE round_completion
+                    SET total = total + 1,
+                        completed = completed + (NEW.result IS NOT NULL AND NEW.result != '')
+                    WHERE round_id = NEW.round_id;
+                END;
+                
+                CREATE TRIGGER IF NOT EXISTS trg_round_completion_pairing_delete
+                AFTER DELETE ON pairings
+                BEGIN
+                    UPDATE round_completion
+                    SET total = total - 1,
+                        completed = completed - (OLD.result IS NOT NULL AND OLD.result != '')
+                    WHERE round_id = OLD.round_id;
+                END;
+                
+                CREATE TRIGGER IF NOT EXISTS trg_round_completion_pairing_update
+                AFTER UPDATE OF result, round_id ON pairings
+                BEGIN
+                    UPDATE round_completion
+                    SET total = total - 1,
+                        completed = completed - (OLD.result IS NOT NULL AND OLD.result != '')
+                    WHERE round_id = OLD.round_id;
+                    UPDATE round_completion
+                    SET total = total + 1,
+                        completed = completed + (NEW.result IS NOT NULL AND NEW.result != '')
+                    WHERE round_id = NEW.round_id;
+                END;
+                
+                COMMIT;
+                """)
+        except sqlite3.Error as e:
+            schema_ok = False
+            print(f"Warning: Could not create round_completion table: {e}")
+            if self.conn.in_transaction:
+                self.conn.rollback()
+        
+        # Cached standings are keyed on a per-tournament revision that triggers
+        # bump whenever anything the standings depend on changes
+        try:
+            self.cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'standings_cache'"
+            )
+            if not self.cursor.fetchone():
+                self.cursor.executescript("""
+                BEGIN;
+                
+                CREATE TABLE IF NOT EXISTS tournament_revisions (
+                    tournament_id INTEGER PRIMARY KEY,
+                    revision INTEGER NOT NULL DEFAULT 1
+                );
+                
+                CREATE TABLE IF NOT EXISTS standings_cache (
+                    tournament_id INTEGER NOT NULL,
+                    view_type TEXT NOT NULL,
+                    revision INTEGER NOT NULL,
+                    payload TEXT NOT NULL,
+                    updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (tournament_id, view_type)
+                );
+                
+                CREATE TRIGGER IF NOT EXISTS trg_revision_tournament_update
+                AFTER UPDATE ON tournaments
+                BEGIN
+                    INSERT INTO tournament_revisions (tournament_id)
+                    SELECT NEW.id WHERE NEW.id IS NOT NULL
+                    ON CONFLICT(tournament_id) DO UPDATE SET revision = revision + 1;
+                END;
+                
+                CREATE TRIGGER IF NOT EXISTS trg_revision_round_insert
+                AFTER INSERT ON rounds
+                BEGIN
+                    INSERT INTO tournament_revisions (tournament_id)
+                    SELECT NEW.tournament_id WHERE NEW.tournament_id IS NOT NULL
+                    ON CONFLICT(tournament_id) DO UPDATE SET revision = revision + 1;
+                END;
+                
+                CREATE TRIGGER IF NOT EXISTS trg_revision_round_update
+                AFTER UPDATE ON rounds
+                BEGIN
+                    INSERT INTO tournament_revisions (tournament_id)
+                    SELECT NEW.tournament_id WHERE NEW.tournament_id IS NOT NULL
+                    ON CONFLICT(tournament_id) DO UPDATE SET revision = revision + 1;
+                END;
+                
+                CREATE TRIGGER IF NOT EXISTS trg_revision_round_delete
+                AFTER DELETE ON rounds
+                BEGIN
+                    INSERT INTO tournament_revisions (tournament_id)
+                    SELECT OLD.tournament_id WHERE OLD.tournament_id IS NOT NULL
+                    ON CONFLICT(tournament_id) DO UPDATE SET revision = revision + 1;
+                END;
+                
+                CREATE TRIGGER IF NOT EXISTS trg_revision_pairing_insert
+                AFTER INSERT ON pairings
+                BEGIN
+                    INSERT INTO tournament_revisions (tournament_id)
+                    SELECT tournament_id FROM rounds WHERE id = NEW.round_id
+                    ON CONFLICT(tournament_id) DO UPDATE SET revision = revision + 1;
+                END;
+                
+                CREATE TRIGGER IF NOT EXISTS trg_revision_pairing_update
+                AFTER UPDATE ON pairings
+                BEGIN
+                    INSERT INTO tournament_revisions (tournament_id)
+                    SELECT tournament_id FROM rounds WHERE id = NEW.round_id
+                    ON CONFLICT(tournament_id) DO UPDATE SET revision = revision + 1;
+                END;
+                
+                CREATE TRIGGER IF NOT EXISTS trg_revision_pairing_delete
+                AFTER DELETE ON pairings
+                BEGIN
+                    INSERT INTO tournament_revisions (tournament_id)
+                    SELECT tournament_id FROM rounds WHERE id = OLD.round_id
+                    ON CONFLICT(tournament_id) DO UPDATE SET revision = revision + 1;
+                END;
+                
+                CREATE TRIGGER IF NOT EXISTS trg_revision_tournament_player_insert
+                AFTER INSERT ON tournament_players
+                BEGIN
+                    INSERT INTO tournament_revisions (tournament_id)
+                    SELECT NEW.tournament_id WHERE NEW.tournament_id IS NOT NULL
+                    ON CONFLICT(tournament_id) DO UPDATE SET revision = revision + 1;
+                END;
+                
+                CREATE TRIGGER IF NOT EXISTS trg_revision_tournament_player_update
+                AFTER UPDATE ON tournament_players
+                BEGIN
+                    INSERT INTO tournament_revisions (tournament_id)
+                    SELECT NEW.tournament_id WHERE NEW.tournament_id IS NOT NULL
+                    ON CONFLICT(tournament_id) DO UPDATE SET revision = revision + 1;
+                END;
+                
+                CREATE TRIGGER IF NOT EXISTS trg_revision_tournament_player_delete
+                AFTER DELETE ON tournament_players
+                BEGIN
+                    INSERT INTO tournament_revisions (tournament_id)
+                    SELECT OLD.tournament_id WHERE OLD.tournament_id IS NOT NULL
+                    ON CONFLICT(tournament_id) DO UPDATE SET revision = revision + 1;
+                END;
+                
+                CREATE TRIGGER IF NOT EXISTS trg_revision_manual_bye_insert
+                AFTER INSERT ON manual_byes
+                BEGIN
+                    INSERT INTO tournament_revisions (tournament_id)
+                    SELECT NEW.tournament_id WHERE NEW.tournament_id IS NOT NULL
+                    ON CONFLICT(tournament_id) DO UPDATE SET revision = revision + 1;
+                END;
+                
+                CREATE TRIGGER IF NOT EXISTS trg_revision_manual_bye_delete
+                AFTER DELETE ON manual_byes
+                BEGIN
+                    INSERT INTO tournament_revisions (tournament_id)
+                    SELECT OLD.tournament_id WHERE OLD.tournament_id IS NOT NULL
+                    ON CONFLICT(tournament_id) DO UPDATE SET revision = revision + 1;
+                END;
+                
+                CREATE TRIGGER IF NOT EXISTS trg_revision_player_update
+                AFTER UPDATE ON players
+                BEGIN
+                    INSERT INTO tournament_revisions (tournament_id)
+                    SELECT tournament_id FROM tournament_players WHERE player_id = NEW.id
+                    UNION
+                    SELECT r.tournament_id FROM pairings p
+                    JOIN rounds r ON p.round_id = r.id
+                    WHERE p.white_player_id = NEW.id OR p.black_player_id = NEW.id
+                    ON CONFLICT(tournament_id) DO UPDATE SET revision = revision + 1;
+                END;
+                
+                CREATE TRIGGER IF NOT EXISTS trg_revision_tournament_delete
+                AFTER DELETE ON tournaments
+                BEGIN
+                    DELETE FROM tournament_revisions WHERE tournament_id = OLD.id;
+                    DELETE FROM standings_cache WHERE tournament_id = OLD.id;
+                END;
+                
+                COMMIT;
+                """)
+        except sqlite3.Error as e:
+            schema_ok = False
+            print(f"Warning: Could not create standings_cache table: {e}")
+            if self.conn.in_transaction:
+                self.conn.rollback()
+        
+        if schema_ok:
+            self.cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
         self.conn.commit()
         
     def update_tournament_status(self, tournament_id: int, status: str) -> bool:
@@ -247,13 +573,23 @@ class TournamentDB:
             A dictionary containing the tournament data, or None if not found or access denied.
         """
         try:
+            # Creator details come from the attached users database when available
+            if self.users_attached:
+                creator_columns = "u.username as creator_username, u.emailAddress as creator_email"
+                creator_join = "LEFT JOIN udb.users u ON u.id = t.creator_id"
+            else:
+                creator_columns = "NULL as creator_username, NULL as creator_email"
+                creator_join = ""
+            
             # First try with user_id check if provided
             if user_id is not None:
-                query = """
+                query = f"""
                     SELECT t.*, 
                            (SELECT COUNT(*) FROM tournament_players WHERE tournament_id = t.id) as player_count,
-                           t.prize_winners as prize_winners
+                           t.prize_winners as prize_winners,
+                           {creator_columns}
                     FROM tournaments t
+                    {creator_join}
                     WHERE t.id = ? AND t.creator_id = ?
                 """
                 self.cursor.execute(query, (tournament_id, user_id))
@@ -262,11 +598,13 @@ class TournamentDB:
                     return dict(result)
             
             # If user_id check failed or not provided, try without user_id check
-            query = """
+            query = f"""
                 SELECT t.*, 
                        (SELECT COUNT(*) FROM tournament_players WHERE tournament_id = t.id) as player_count,
-                       t.prize_winners as prize_winners
+                       t.prize_winners as prize_winners,
+                       {creator_columns}
                 FROM tournaments t
+                {creator_join}
                 WHERE t.id = ?
             """
             self.cursor.execute(query, (tournament_id,))
@@ -328,98 +666,36 @@ class TournamentDB:
             print(f"Error getting current round for tournament {tournament_id}: {e}")
             return None
             
-    def get_pairings(self, round_id: int) -> List[Dict[str, Any]]:
-        """Get all pairings for a round, including byes.
+    def get_current_round_with_byes(self, tournament_id: int) -> Optional[Dict[str, Any]]:
+        """Get the current round for a tournament together with its manual byes.
         
         Args:
-            round_id: The ID of the round to get pairings for.
+            tournament_id: The ID of the tournament.
             
         Returns:
-            A list of dictionaries containing pairing information, including player details.
-            Each pairing has an 'is_bye' flag set to True if it's a bye pairing.
+            The current round data with an extra 'bye_player_ids' field holding
+            the comma-separated IDs of players with a manual bye (None if there
+            are none), or None if the tournament has no rounds.
         """
         try:
-            # First, get the round details to determine the round number
             self.cursor.execute("""
-                SELECT id, round_number, tournament_id 
-                FROM rounds 
-                WHERE id = ?
-            """, (round_id,))
-            round_info = self.cursor.fetchone()
-            
-            if not round_info:
-                return []
-                
-            round_number = round_info['round_number']
-            tournament_id = round_info['tournament_id']
-            
-            # Get all manual byes for this round
-            self.cursor.execute("""
-                SELECT mb.player_id, p.name, p.rating
-                FROM manual_byes mb
-                JOIN players p ON mb.player_id = p.id
-                WHERE mb.tournament_id = ? AND mb.round_number = ?
-            """, (tournament_id, round_number))
-            
-            manual_byes = {row['player_id']: dict(row) for row in self.cursor.fetchall()}
-            
-            # Get all pairings for the round
-            self.cursor.execute("""
-                SELECT 
-                    p.id, p.board_number, p.status, p.result,
-                    p.white_player_id, p.black_player_id,
-                    w.name as white_name, w.rating as white_rating,
-                    b.name as black_name, b.rating as black_rating
-                FROM pairings p
-                LEFT JOIN players w ON p.white_player_id = w.id
-                LEFT JOIN players b ON p.black_player_id = b.id
-                WHERE p.round_id = ?
-                ORDER BY 
-                    CASE WHEN p.black_player_id IS NULL THEN 0 ELSE 1 END,  # Bye pairings first
-                    p.board_number
-            """, (round_id,))
-            
-            pairings = []
-            for row in self.cursor.fetchall():
-                pairing = dict(row)
-                # Add is_bye flag
-                is_bye = pairing['black_player_id'] is None
-                pairing['is_bye'] = is_bye
-                
-                # If this is a bye pairing, ensure the player is in the manual_byes set
-                if is_bye and pairing['white_player_id'] in manual_byes:
-                    manual_byes.pop(pairing['white_player_id'])
-                    
-                pairings.append(pairing)
-            
-            # Add any manual byes that weren't found in the pairings table
-            for player_id, player_info in manual_byes.items():
-                pairings.append({
-                    'id': None,
-                    'board_number': 0,  # Will be updated below
-                    'status': 'completed',
-                    'result': '1-0',  # Bye is a win for the player
-                    'white_player_id': player_id,
-                    'black_player_id': None,
-                    'white_name': player_info['name'],
-                    'white_rating': player_info['rating'],
-                    'black_name': None,
-                    'black_rating': None,
-                    'is_bye': True
-                })
-            
-            # Sort pairings to ensure byes are first and have sequential board numbers
-            pairings.sort(key=lambda x: (0 if x['is_bye'] else 1, x.get('board_number', 0)))
+                SELECT r.*,
+                       (SELECT GROUP_CONCAT(mb.player_id)
+                        FROM manual_byes mb
+                        WHERE mb.tournament_id = r.tournament_id
+                          AND mb.round_number = r.round_number) as bye_player_ids
+                FROM rounds r
+                WHERE r.tournament_id = ? 
+                ORDER BY r.round_number DESC 
+                LIMIT 1
+            """, (tournament_id,))
             
-            # Ensure board numbers are sequential
-            for i, pairing in enumerate(pairings, 1):
-                pairing['board_number'] = i
-                
-            return pairings
+            result = self.cursor.fetchone()
+            return dict(result) if result else None
             
         except sqlite3.Error as e:
-            print(f"Error getting pairings: {e}")
-            return []
+            print(f"Error getting current round for tournament {tournament_id}: {e}")
+            return None
             
     def get_round_pairings(self, round_id: int) -> List[Dict[str, Any]]:
         """Get all pairings for a specific round, including byes.
@@ -529,6 +805,37 @@ class TournamentDB:
             print(f"Error getting all players: {e}")
             return []
             
+    def get_available_players(self, tournament_id: int) -> List[Dict[str, Any]]:
+        """Get the players who can still be added to a tournament.
+        
+        Args:
+            tournament_id: The ID of the tournament
+            
+        Returns:
+            Players from get_all_players that are not yet in the tournament
+        """
+        try:
+            self.cursor.execute("""
+                SELECT p.id, p.name, p.rating, p.team, p.created_at
+                FROM players p
+                INNER JOIN (
+                    SELECT name, rating, MAX(created_at) as latest_created
+                    FROM players
+                    GROUP BY name, rating
+                ) latest ON p.name = latest.name 
+                        AND p.rating = latest.rating 
+                        AND p.created_at = latest.latest_created
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM tournament_players tp
+                    WHERE tp.player_id = p.id AND tp.tournament_id = ?
+                )
+                ORDER BY p.name, p.rating
+            """, (tournament_id,))
+            return [dict(row) for row in self.cursor.fetchall()]
+        except sqlite3.Error as e:
+            print(f"Error getting available players: {e}")
+            return []
+            
     def get_player_match_history(self, tournament_id: int, player_id: int) -> List[Dict[str, Any]]:
         """Get a player's match history in a tournament.
         
@@ -1641,10 +1948,54 @@ class TournamentDB:
         except sqlite3.Error as e:
             print(f"Error getting tournaments by creator {creator_id}: {e}")
             return []
+
+    def get_user_dashboard_tournaments(self, user_id: int, share_link_ids: List[int],
+                                       hidden_ids: List[int]) -> List[Dict[str, Any]]:
+        """Get the tournaments shown on a user's dashboard in a single query.
+        
+        Args:
+            user_id: The ID of the user
+            share_link_ids: IDs of tournaments the user holds share links for
+            hidden_ids: IDs of tournaments the user has hidden
+            
+        Returns:
+            The user's own tournaments followed by those shared with them, each
+            with a via_share_link flag, excluding hidden tournaments.
+        """
+        columns = """
+            SELECT t.*,
+                   (SELECT COUNT(*) FROM tournament_players WHERE tournament_id = t.id) as player_count,
+                   {via_share_link} as via_share_link
+            FROM tournaments t
+        """
+        query = columns.format(via_share_link=0) + " WHERE t.creator_id = ?"
+        params = [user_id]
+        if share_link_ids:
+            placeholders = ", ".join("?" * len(share_link_ids))
+            query += " UNION ALL " + columns.format(via_share_link=1) + \
+                f" WHERE t.id IN ({placeholders}) AND t.creator_id IS NOT ?"
+            params += [*share_link_ids, user_id]
+        
+        query = f"SELECT * FROM ({query})"
+        if hidden_ids:
+            query += f" WHERE id NOT IN ({', '.join('?' * len(hidden_ids))})"
+            params += hidden_ids
+        query += " ORDER BY via_share_link, start_date DESC, created_at DESC"
+        
+        try:
+            self.cursor.execute(query, params)
+            return [dict(row) for row in self.cursor.fetchall()]
+        except sqlite3.Error as e:
+            print(f"Error getting dashboard tournaments for user {user_id}: {e}")
+            return []
             
     def close(self):
         """Close the database connection."""
         if self.conn:
+            try:
+                self.conn.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                pass
             self.conn.close()
             self.conn = None
             self.cursor = None
@@ -1748,6 +2099,66 @@ class TournamentDB:
         self.conn.commit()
         return self.cursor.lastrowid
 
+    def create_pairings_bulk(self, round_id: int, rows: List[Tuple[int, Optional[int], int]]) -> bool:
+        """Create several pairings for a round in one transaction.
+        
+        Byes (rows without a black player) are recorded as completed 1-0 wins
+        and credited to the player's score, as in create_pairing.
+        
+        Args:
+            round_id: ID of the round
+            rows: (white_id, black_id, board_number) tuples; black_id is None for a bye
+            
+        Returns:
+            bool: True if the pairings were created, False otherwise
+        """
+        if not rows:
+            return True
+        byes = [(round_id, white_id, board) for white_id, black_id, board in rows if black_id is None]
+        games = [(round_id, white_id, black_id, board) for white_id, black_id, board in rows if black_id is not None]
+        try:
+            with self.conn:
+                self.cursor.executemany("""
+                    INSERT INTO pairings (round_id, white_player_id, black_player_id, board_number, status, result)
+                    VALUES (?, ?, NULL, ?, 'completed', '1-0')
+                """, byes)
+                self.cursor.executemany("""
+                    UPDATE tournament_players 
+                    SET score = score + 1 
+                    WHERE player_id = ? 
+                    AND tournament_id = (SELECT tournament_id FROM rounds WHERE id = ?)
+                """, [(white_id, round_id) for _, white_id, _ in byes])
+                self.cursor.executemany("""
+                    INSERT INTO pairings (round_id, white_player_id, black_player_id, board_number, status)
+                    VALUES (?, ?, ?, ?, 'pending')
+                """, games)
+            return True
+        except sqlite3.Error as e:
+            print(f"Error creating pairings: {e}")
+            return False
+
+    def restore_pairing_results(self, results: List[Tuple[str, int]]) -> bool:
+        """Write back previously recorded results onto regenerated pairings.
+        
+        Args:
+            results: (result, pairing_id) tuples to restore
+            
+        Returns:
+            bool: True if the results were written, False otherwise
+        """
+        if not results:
+            return True
+        try:
+            with self.conn:
+                self.cursor.executemany(
+                    "UPDATE pairings SET result = ?, status = 'completed' WHERE id = ?",
+                    results
+                )
+            return True
+        except sqlite3.Error as e:
+            print(f"Error restoring pairing results: {e}")
+            return False
+
     def record_result(self, pairing_id: int, result: Optional[str]) -> bool:
         """
         Record the result of a game.
@@ -1902,6 +2313,29 @@ class TournamentDB:
             self.conn.rollback()
             return False
         
+    def get_owned_tournament_ids(self, tournament_ids: List[int], creator_id: int) -> set:
+        """Get which of the given tournaments exist and were created by a user.
+        
+        Args:
+            tournament_ids: IDs of the tournaments to check
+            creator_id: The ID of the user
+            
+        Returns:
+            Set of the IDs from tournament_ids that belong to the user
+        """
+        if not tournament_ids:
+            return set()
+        try:
+            placeholders = ','.join('?' * len(tournament_ids))
+            self.cursor.execute(
+                f"SELECT id FROM tournaments WHERE id IN ({placeholders}) AND creator_id = ?",
+                (*tournament_ids, creator_id)
+            )
+            return {row['id'] for row in self.cursor.fetchall()}
+        except sqlite3.Error as e:
+            print(f"Error checking tournament ownership: {e}")
+            return set()
+            
     def delete_tournament(self, tournament_id: int, creator_id: int) -> bool:
         """
         Delete a tournament and all its related data.
@@ -1978,6 +2412,45 @@ class TournamentDB:
                 self.conn.rollback()
             return False
             
+    def delete_tournaments(self, tournament_ids: List[int], creator_id: int) -> List[int]:
+        """Delete several tournaments and all their related data in one transaction.
+        
+        Tournaments that do not exist or were not created by creator_id are skipped.
+        
+        Args:
+            tournament_ids: The IDs of the tournaments to delete
+            creator_id: The ID of the user attempting to delete
+            
+        Returns:
+            List of the IDs that were deleted (empty if the deletion failed)
+        """
+        owned_ids = sorted(self.get_owned_tournament_ids(tournament_ids, creator_id))
+        if not owned_ids:
+            return []
+        
+        placeholders = ','.join('?' * len(owned_ids))
+        try:
+            self.cursor.execute("BEGIN IMMEDIATE")
+            
+            self.cursor.execute(f"""
+                DELETE FROM pairings 
+                WHERE round_id IN (SELECT id FROM rounds WHERE tournament_id IN ({placeholders}))
+            """, owned_ids)
+            for table in ('manual_byes', 'rounds', 'tournament_players', 'admin_share_links'):
+                self.cursor.execute(
+                    f"DELETE FROM {table} WHERE tournament_id IN ({placeholders})",
+                    owned_ids
+                )
+            self.cursor.execute(f"DELETE FROM tournaments WHERE id IN ({placeholders})", owned_ids)
+            
+            self.conn.commit()
+            return owned_ids
+            
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            print(f"Error deleting tournaments {owned_ids}: {e}")
+            return []
+            
     def is_tournament_complete(self, tournament_id: int) -> bool:
         """Check if a tournament is complete (all rounds finished with results)."""
         # Get tournament info
@@ -2113,6 +2586,176 @@ class TournamentDB:
             print(f"Error getting rounds for tournament {tournament_id}: {e}")
             return []
             
+    def get_round_completion(self, tournament_id: int, round_number: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get the pairing completion status of a tournament's rounds in one query.
+        
+        Args:
+            tournament_id: ID of the tournament
+            round_number: Optional round number to restrict the result to
+            
+        Returns:
+            List of dicts with id, round_number, total_pairings, completed_pairings,
+            is_completed (has pairings and all have results) and is_current
+            (highest round number), ordered by round number
+        """
+        try:
+            if round_number is None:
+                self.cursor.execute(ROUND_COMPLETION_SQL, (tournament_id,))
+            else:
+                self.cursor.execute(ROUND_COMPLETION_ONE_SQL, (tournament_id, round_number))
+            return [dict(row) for row in self.cursor.fetchall()]
+        except sqlite3.Error as e:
+            print(f"Error getting round completion for tournament {tournament_id}: {e}")
+            return []
+            
+    def round_has_missing_results(self, round_id: int) -> bool:
+        """Check whether a round still has games without a result.
+        
+        Byes are ignored. The query stops at the first unfinished game and is
+        answered from the pairings indexes (idx_pairings_incomplete or
+        idx_pairings_round_result).
+        
+        Args:
+            round_id: ID of the round
+            
+        Returns:
+            bool: True if at least one game has no result yet
+        """
+        try:
+            self.cursor.execute("""
+                SELECT 1 FROM pairings
+                WHERE round_id = ? AND black_player_id IS NOT NULL
+                AND (result IS NULL OR result = '')
+                LIMIT 1
+            """, (round_id,))
+            return self.cursor.fetchone() is not None
+        except sqlite3.Error as e:
+            print(f"Error checking results for round {round_id}: {e}")
+            return True
+            
+    def pairing_in_tournament(self, pairing_id: int, tournament_id: int) -> bool:
+        """Check whether a pairing belongs to one of a tournament's rounds.
+        
+        Both lookups are key seeks: the pairing by its primary key and its
+        round through idx_rounds_tournament (tournament_id, id).
+        
+        Args:
+            pairing_id: ID of the pairing
+            tournament_id: ID of the tournament
+            
+        Returns:
+            bool: True if the pairing is part of the tournament
+        """
+        try:
+            self.cursor.execute("""
+                SELECT 1 FROM pairings p
+                JOIN rounds r ON p.round_id = r.id
+                WHERE p.id = ? AND r.tournament_id = ?
+            """, (pairing_id, tournament_id))
+            return self.cursor.fetchone() is not None
+        except sqlite3.Error as e:
+            print(f"Error checking pairing {pairing_id}: {e}")
+            return False
+            
+    def get_pairing_signature(self, tournament_id: int, round_number: int) -> str:
+        """Get a stable signature of the inputs that decide a round's pairings.
+        
+        Covers the tournament's current roster and the manual byes assigned for
+        the round, so adding, removing or withdrawing a player changes it.
+        
+        Args:
+            tournament_id: ID of the tournament
+            round_number: The round number
+            
+        Returns:
+            Hex digest of the sorted roster and manual bye player IDs
+        """
+        try:
+            self.cursor.execute("""
+                SELECT (
+                    SELECT GROUP_CONCAT(player_id) FROM (
+                        SELECT player_id FROM tournament_players
+                        WHERE tournament_id = ?
+                        ORDER BY player_id
+                    )
+                ), (
+                    SELECT GROUP_CONCAT(player_id) FROM (
+                        SELECT player_id FROM manual_byes
+                        WHERE tournament_id = ? AND round_number = ?
+                        ORDER BY player_id
+                    )
+                )
+            """, (tournament_id, tournament_id, round_number))
+            roster, byes = self.cursor.fetchone()
+            return hashlib.sha1(f"players:{roster or ''}|byes:{byes or ''}".encode()).hexdigest()
+        except sqlite3.Error as e:
+            print(f"Error getting pairing signature for round {round_number}: {e}")
+            return ''
+            
+    def pairings_already_generated(self, round_id: int, method: str, byes_signature: str) -> bool:
+        """Check whether a round's current pairings were generated with the same inputs.
+        
+        Args:
+            round_id: ID of the round
+            method: Pairing method that would be used
+            byes_signature: Signature from get_pairing_signature
+            
+        Returns:
+            bool: True if the round's latest logged generation matches and its pairings still exist
+        """
+        try:
+            self.cursor.execute("""
+                SELECT EXISTS (
+                    SELECT 1 FROM pairing_generation_log
+                    WHERE round_id = ? AND method = ? AND byes_signature = ?
+                ) AND EXISTS (
+                    SELECT 1 FROM pairings WHERE round_id = ?
+                )
+            """, (round_id, method, byes_signature, round_id))
+            return bool(self.cursor.fetchone()[0])
+        except sqlite3.Error as e:
+            print(f"Error checking pairing generation log: {e}")
+            return False
+            
+    def log_pairing_generation(self, round_id: int, method: str, byes_signature: str) -> bool:
+        """Record the latest pairing generation for a round, replacing any earlier one.
+        
+        Args:
+            round_id: ID of the round
+            method: Pairing method that was used
+            byes_signature: Signature from get_pairing_signature
+            
+        Returns:
+            bool: True if the entry was recorded, False otherwise
+        """
+        try:
+            self.cursor.execute("""
+                INSERT OR REPLACE INTO pairing_generation_log (round_id, method, byes_signature)
+                VALUES (?, ?, ?)
+            """, (round_id, method, byes_signature))
+            self.conn.commit()
+            return True
+        except sqlite3.Error as e:
+            print(f"Error logging pairing generation: {e}")
+            return False
+            
+    def clear_pairing_generation(self, round_id: int) -> bool:
+        """Forget a round's logged generation once its pairings have been changed by hand.
+        
+        Args:
+            round_id: ID of the round
+            
+        Returns:
+            bool: True if the entry was removed or there was none, False otherwise
+        """
+        try:
+            self.cursor.execute("DELETE FROM pairing_generation_log WHERE round_id = ?", (round_id,))
+            self.conn.commit()
+            return True
+        except sqlite3.Error as e:
+            print(f"Error clearing pairing generation log: {e}")
+            return False
+            
     def get_player_standings(self, tournament_id: int) -> List[Dict[str, Any]]:
         """Get player standings for a tournament.
         
@@ -2262,9 +2905,32 @@ class TournamentDB:
             print(f"Error getting team standings: {e}")
             return []
 
+    def get_tournament_revision(self, tournament_id: int) -> int:
+        """Get the revision counter of a tournament.
+        
+        The revision is bumped by triggers whenever the tournament, its rounds,
+        pairings, players or byes change, so it identifies a snapshot of the
+        tournament's data.
+        
+        Args:
+            tournament_id: ID of the tournament
+            
+        Returns:
+            The current revision, or 0 if the tournament has never changed
+        """
+        self.cursor.execute(
+            "SELECT revision FROM tournament_revisions WHERE tournament_id = ?",
+            (tournament_id,)
+        )
+        row = self.cursor.fetchone()
+        return row['revision'] if row else 0
+
     def get_standings(self, tournament_id: int, view_type: str = 'individual') -> List[Dict[str, Any]]:
         """Get current tournament standings with all required fields for the standings page.
         
+        Standings are served from standings_cache while the tournament's revision
+        is unchanged, and recalculated and stored again otherwise.
+        
         Args:
             tournament_id: ID of the tournament
             view_type: Either 'individual' or 'team' to specify the type of standings to return
@@ -2272,11 +2938,49 @@ class TournamentDB:
         Returns:
             List of dictionaries containing player or team standings
         """
+        view_type = 'team' if view_type == 'team' else 'individual'
+        try:
+            revision = self.get_tournament_revision(tournament_id)
+            self.cursor.execute("""
+                SELECT payload FROM standings_cache
+                WHERE tournament_id = ? AND view_type = ? AND revision = ?
+            """, (tournament_id, view_type, revision))
+            cached = self.cursor.fetchone()
+            if cached:
+                return json.loads(cached['payload'])
+        except sqlite3.Error as e:
+            print(f"Error reading cached standings: {e}")
+            revision = None
+        
+        if view_type == 'team':
+            standings = self.get_team_standings(tournament_id)
+        else:
+            standings = self._calculate_standings(tournament_id)
+        
+        if standings and revision is not None:
+            try:
+                self.cursor.execute("""
+                    INSERT OR REPLACE INTO standings_cache (tournament_id, view_type, revision, payload)
+                    VALUES (?, ?, ?, ?)
+                """, (tournament_id, view_type, revision, json.dumps(standings)))
+                self.conn.commit()
+            except sqlite3.Error as e:
+                print(f"Error caching standings: {e}")
+        
+        return standings
+
+    def _calculate_standings(self, tournament_id: int) -> List[Dict[str, Any]]:
+        """Calculate individual standings, points and tiebreaks from the pairings.
+        
+        Args:
+            tournament_id: ID of the tournament
+            
+        Returns:
+            List of player standings, best first
+        """
         import logging
         logger = logging.getLogger(__name__)
-        logger.debug(f"get_standings called with tournament_id={tournament_id}, view_type={view_type}")
-        if view_type == 'team':
-            return self.get_team_standings(tournament_id)
+        logger.debug(f"_calculate_standings called with tournament_id={tournament_id}")
             
         # Get all players who have ever been in the tournament
         query = """
@@ -2510,6 +3214,10 @@ class TournamentDB:
             )
         )
         
+        # Rank is the position in the sorted standings
+        for rank, player in enumerate(standings, 1):
+            player['rank'] = rank
+        
         return standings
 
     def get_pairing(self, pairing_id: int) -> Optional[Dict[str, Any]]:
@@ -2576,6 +3284,83 @@ class TournamentDB:
             pairings.append(pairing)
         return pairings
 
+    def get_recent_pairings(self, tournament_id: int, limit: int = 10) -> List[Dict[str, Any]]:
+        """Get the most recent pairings of a tournament with player names resolved.
+
+        Args:
+            tournament_id: The ID of the tournament
+            limit: Maximum number of pairings to return
+
+        Returns:
+            List of dicts with round_number, white_name, black_name and result,
+            oldest first.
+        """
+        query = """
+        SELECT * FROM (
+            SELECT r.round_number,
+                   COALESCE(w.name, 'Unknown') AS white_name,
+                   CASE WHEN p.black_player_id IS NULL THEN 'Bye'
+                        ELSE COALESCE(b.name, 'Unknown') END AS black_name,
+                   COALESCE(p.result, 'Not played') AS result,
+                   p.board_number
+            FROM pairings p
+            JOIN rounds r ON p.round_id = r.id
+            LEFT JOIN players w ON p.white_player_id = w.id
+            LEFT JOIN players b ON p.black_player_id = b.id
+            WHERE r.tournament_id = ?
+            ORDER BY r.round_number DESC, p.board_number DESC
+            LIMIT ?
+        )
+        ORDER BY round_number, board_number
+        """
+        try:
+            self.cursor.execute(query, (tournament_id, limit))
+            return [dict(row) for row in self.cursor.fetchall()]
+        except sqlite3.Error as e:
+            print(f"Error getting recent pairings: {e}")
+            return []
+
+    def iter_all_pairings_with_names(self, tournament_id: int) -> Iterator[sqlite3.Row]:
+        """Stream every pairing of a tournament with player names resolved in one query.
+
+        Rows are read from a dedicated cursor as they are consumed, so exports
+        never hold the whole result in memory and other queries can still run
+        on self.cursor meanwhile.
+
+        Args:
+            tournament_id: The ID of the tournament
+
+        Returns:
+            Iterator of rows of (round_number, board_number, white_name,
+            black_name, result), ordered by round and then as get_pairings
+            orders a round. Missing players are named 'BYE', deleted ones
+            'Unknown Player', and unplayed results are ''. Pairings with no
+            player on either side are skipped.
+        """
+        query = """
+        SELECT r.round_number,
+               p.board_number,
+               CASE WHEN p.white_player_id IS NULL THEN 'BYE'
+                    ELSE COALESCE(w.name, 'Unknown Player') END AS white_name,
+               CASE WHEN p.black_player_id IS NULL THEN 'BYE'
+                    ELSE COALESCE(b.name, 'Unknown Player') END AS black_name,
+               COALESCE(p.result, '') AS result
+        FROM pairings p
+        JOIN rounds r ON p.round_id = r.id
+        LEFT JOIN players w ON p.white_player_id = w.id
+        LEFT JOIN players b ON p.black_player_id = b.id
+        WHERE r.tournament_id = ?
+        AND (p.white_player_id IS NOT NULL OR p.black_player_id IS NOT NULL)
+        ORDER BY r.round_number,
+                 CASE WHEN p.black_player_id IS NULL THEN 1 ELSE 0 END,
+                 p.board_number
+        """
+        try:
+            return self.conn.cursor().execute(query, (tournament_id,))
+        except sqlite3.Error as e:
+            print(f"Error getting pairings for tournament {tournament_id}: {e}")
+            return iter([])
+
     def is_current_round_complete(self, tournament_id: int) -> bool:
         """Check if all results are in for the current round.
         
@@ -2630,8 +3415,11 @@ class TournamentDB:
         self.cursor.execute(query, params)
         return [dict(row) for row in self.cursor.fetchall()]
 
-    def add_player_to_tournament(self, tournament_id: int, player_id: int) -> bool:
-        """Add a player to a tournament."""
+    def add_player_to_tournament(self, tournament_id: int, player_id: int, commit: bool = True) -> bool:
+        """Add a player to a tournament.
+        
+        Pass commit=False to leave the insert in the caller's open transaction.
+        """
         try:
             # Get player's current rating
             self.cursor.execute("SELECT rating FROM players WHERE id = ?", (player_id,))
@@ -2647,15 +3435,57 @@ class TournamentDB:
                 VALUES (?, ?, ?)
             """, (tournament_id, player_id, rating))
             
-            self.conn.commit()
+            if commit:
+                self.conn.commit()
             return True
             
         except sqlite3.IntegrityError:
             # Player is already in the tournament
-            self.conn.rollback()
+            if commit:
+                self.conn.rollback()
             return False
             
         except sqlite3.Error as e:
             print(f"Error adding player to tournament: {e}")
-            self.conn.rollback()
+            if commit:
+                self.conn.rollback()
             return False
+
+    def add_players_to_tournament(self, tournament_id: int, players: List[Tuple[str, int, Optional[str]]]) -> int:
+        """Create several players and enter them into a tournament in one transaction.
+        
+        The players are inserted with executemany, then entered into the
+        tournament by a single INSERT ... SELECT over the new player IDs.
+        
+        Args:
+            tournament_id: The ID of the tournament
+            players: (name, rating, team) tuples; team may be None
+            
+        Returns:
+            int: Number of players added (0 if the import failed)
+        """
+        if not players:
+            return 0
+        try:
+            # Take the write lock first so no other insert can interleave with the new IDs
+            self.cursor.execute("BEGIN IMMEDIATE")
+            self.cursor.execute("SELECT COALESCE(MAX(id), 0) FROM players")
+            last_id = self.cursor.fetchone()[0]
+            
+            self.cursor.executemany("""
+                INSERT INTO players (name, rating, team, created_at)
+                VALUES (?, ?, ?, datetime('now'))
+            """, players)
+            self.cursor.execute("""
+                INSERT INTO tournament_players (tournament_id, player_id, initial_rating)
+                SELECT ?, id, rating FROM players WHERE id > ?
+            """, (tournament_id, last_id))
+            added = self.cursor.rowcount
+            
+            self.conn.commit()
+            return added
+            
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            print(f"Error importing players into tournament {tournament_id}: {e}")
+            return 0
@@ -1,31 +1,44 @@
-from flask import Blueprint, render_template, request, redirect, url_for, flash, session, g, current_app, jsonify, send_file
-from flask_wtf.csrf import generate_csrf
+from flask import Blueprint, render_template, request, redirect, url_for, flash, session, g, current_app, jsonify, send_file, make_response, Response, stream_with_context
 from flask_wtf import FlaskForm
 from wtforms import SelectField, BooleanField, IntegerField, StringField, TextAreaField, SubmitField, DateField, FloatField, DecimalField
 from wtforms.validators import DataRequired, NumberRange, InputRequired
 import os
-import pandas as pd
+import io
+import csv
 import random
+import threading
+import time
+import hashlib
+import traceback
 from werkzeug.utils import secure_filename
-from functools import wraps
+from urllib.parse import quote
+from functools import wraps, lru_cache
+from itertools import chain, islice
 from types import SimpleNamespace
 from tournament_db import TournamentDB
 import os
 import sqlite3
-from datetime import datetime
+from datetime import datetime, timezone
 from decorators import check_tournament_active
 import json
 from typing import Dict, List, Optional, Tuple, Any
-from openai import OpenAI
-from dotenv import load_dotenv
 from sql import SQL
 
 
-# Load environment variables
-load_dotenv()
+@lru_cache(maxsize=1)
+def _openai_client():
+    """Create the OpenAI client on first use rather than at import time."""
+    from openai import OpenAI
+    return OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
-# Initialize the OpenAI client
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+@lru_cache(maxsize=1)
+def _pandas():
+    """Import pandas on first use; only the spreadsheet imports and exports need it."""
+    import pandas
+    return pandas
+
+# Same game seen from the other side of the board
+_FLIPPED_RESULTS = {'1-0': '0-1', '0-1': '1-0'}
 
 def regenerate_current_round_pairings(db: TournamentDB, tournament_id: int) -> bool:
     """Regenerate pairings for the current round, preserving any existing results.
@@ -39,33 +52,34 @@ def regenerate_current_round_pairings(db: TournamentDB, tournament_id: int) -> b
     """
     try:
         # Get current round
-        current_round = db.get_current_round(tournament_id)
+        current_round = cached_current_round(tournament_id)
         if not current_round:
             return False
             
         round_id = current_round['id']
         
-        # Get existing pairings with results
+        # Index completed games by the pair of players so a game still
+        # matches after re-pairing swaps the colours
         existing_pairings = db.get_pairings(round_id)
-        completed_results = {}
-        
-        # Store completed results
-        for pairing in existing_pairings:
-            if pairing.get('result'):
-                white_id = pairing.get('white_player_id')
-                black_id = pairing.get('black_player_id')
-                if white_id and black_id:  # Only store results for actual games, not byes
-                    completed_results[(white_id, black_id)] = pairing['result']
+        completed_results = {
+            frozenset((white_id, black_id)): (white_id, result)
+            for pairing in existing_pairings
+            if (result := pairing.get('result'))
+            and (white_id := pairing.get('white_player_id'))
+            and (black_id := pairing.get('black_player_id'))  # Skip byes
+        }
         
         # Regenerate pairings
         success = db.generate_pairings(tournament_id, round_id, 'swiss')
         if not success:
             return False
+        db.clear_pairing_generation(round_id)
             
         # Get new pairings
         new_pairings = db.get_pairings(round_id)
         
-        # Restore completed results where possible
+        # Restore completed results where possible, in a single batch
+        restored = []
         for pairing in new_pairings:
             white_id = pairing.get('white_player_id')
             black_id = pairing.get('black_player_id')
@@ -73,20 +87,17 @@ def regenerate_current_round_pairings(db: TournamentDB, tournament_id: int) -> b
             if not white_id or not black_id:
                 continue  # Skip byes
                 
-            result = completed_results.get((white_id, black_id))
-            if result:
-                db.update_pairing_result(
-                    pairing['id'],
-                    white_id,
-                    black_id,
-                    result,
-                    'completed'
-                )
-                
-        return True
+            previous = completed_results.get(frozenset((white_id, black_id)))
+            if previous:
+                previous_white, result = previous
+                if previous_white != white_id:
+                    result = _FLIPPED_RESULTS.get(result, result)
+                restored.append((result, pairing['id']))
         
-    except Exception as e:
-        print(f"Error regenerating pairings: {e}")
+        return db.restore_pairing_results(restored)
+        
+    except Exception:
+        current_app.logger.exception("Error regenerating pairings")
         return False
 
 # Create blueprint
@@ -109,6 +120,50 @@ def get_db(f=None):
         return f(*args, **kwargs)
     return decorated_function
 
+def cached_tournament(tournament_id: int) -> Optional[Dict[str, Any]]:
+    """Get a tournament, memoized on g for the rest of the request."""
+    cache = g.setdefault('tournament_cache', {})
+    if tournament_id not in cache:
+        cache[tournament_id] = get_db().get_tournament(tournament_id)
+    return cache[tournament_id]
+
+def cached_current_round(tournament_id: int) -> Optional[Dict[str, Any]]:
+    """Get a tournament's current round, memoized on g for the rest of the request.
+    
+    The round carries its manual byes in 'bye_player_ids' (see
+    get_current_round_with_byes).
+    """
+    cache = g.setdefault('current_round_cache', {})
+    if tournament_id not in cache:
+        cache[tournament_id] = get_db().get_current_round_with_byes(tournament_id)
+    return cache[tournament_id]
+
+def cached_pairing_signature(tournament_id: int, round_number: int) -> str:
+    """Get the roster and manual byes signature of a round, memoized on g for the rest of the request."""
+    cache = g.setdefault('pairing_signature_cache', {})
+    key = (tournament_id, round_number)
+    if key not in cache:
+        cache[key] = get_db().get_pairing_signature(tournament_id, round_number)
+    return cache[key]
+
+def invalidate_tournament_cache(tournament_id: int):
+    """Drop the request-scoped tournament and current round entries after a write."""
+    g.get('tournament_cache', {}).pop(tournament_id, None)
+    g.get('current_round_cache', {}).pop(tournament_id, None)
+
+# Serializes the multi-statement write transactions of this blueprint within
+# the process, so requests queue here rather than on SQLite's database lock
+_write_lock = threading.Lock()
+
+# Pin/hide toggles are fired rapidly from the dashboard; only log a sample of their failures
+TOGGLE_ERROR_LOG_SAMPLE_RATE = 0.01
+
+@tournament_bp.before_request
+def _load_user():
+    """Expose the logged-in user's id and admin flag on g for the handlers."""
+    g.user_id = session.get('user_id')
+    g.is_admin = session.get('is_admin', False)
+
 # Login required decorator
 def login_required(f):
     @wraps(f)
@@ -119,6 +174,40 @@ def login_required(f):
         return f(*args, **kwargs)
     return decorated_function
 
+def _page_etag(*parts) -> Optional[str]:
+    """Build an ETag for a page from the data it displays.
+    
+    The user's session details shown in the layout and the current CSRF
+    token window are mixed in, so a cached copy never carries an expired
+    token. Returns None when the page has flashed messages to show and
+    must be rendered fresh.
+    """
+    if session.get('_flashes'):
+        return None
+    token_lifetime = current_app.config.get('WTF_CSRF_TIME_LIMIT') or 3600
+    key = (
+        request.full_path,
+        session.get('user_id'),
+        session.get('name'),
+        session.get('is_admin'),
+        session.get('profile_pic'),
+        session.get('csrf_token'),
+        int(time.time() // (token_lifetime / 2)),
+    ) + parts
+    return hashlib.sha1(repr(key).encode()).hexdigest()
+
+def _conditional_response(etag: Optional[str], render):
+    """Return 304 if the client already has the page for etag, else call render()."""
+    if etag and request.if_none_match.contains(etag):
+        response = current_app.response_class(status=304)
+    else:
+        response = make_response(render())
+        if not etag or response.status_code != 200:
+            return response
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
+
 @tournament_bp.route('/<int:tournament_id>/player/<int:player_id>/history')
 @login_required
 @get_db
@@ -173,9 +262,12 @@ def hidden_tournaments():
         # Filter hidden tournaments
         hidden_tournaments = [t for t in all_tournaments if t['id'] in hidden_tournament_ids]
         
-        return render_template('tournament/hidden.html', tournaments=hidden_tournaments)
-    except Exception as e:
-        print(f"Error retrieving hidden tournaments: {e}")
+        etag = _page_etag(hidden_tournaments)
+        return _conditional_response(
+            etag, lambda: render_template('tournament/hidden.html', tournaments=hidden_tournaments)
+        )
+    except Exception:
+        current_app.logger.exception("Error retrieving hidden tournaments")
         flash('An error occurred while retrieving hidden tournaments.', 'error')
         return redirect(url_for('tournament.index'))
 
@@ -197,8 +289,9 @@ def unhide_tournament(tournament_id):
             return jsonify({'success': True})
         return jsonify({'success': False, 'message': 'Tournament was not hidden'}), 400
         
-    except Exception as e:
-        print(f"Error unhiding tournament: {e}")
+    except Exception:
+        if random.random() < TOGGLE_ERROR_LOG_SAMPLE_RATE:
+            current_app.logger.exception("Error unhiding tournament")
         return jsonify({'success': False, 'message': 'An error occurred while unhiding the tournament'}), 500
 
 @tournament_bp.route('/<int:tournament_id>/pin', methods=['POST'])
@@ -218,8 +311,9 @@ def pin_tournament(tournament_id):
         
         return jsonify({'success': True})
         
-    except Exception as e:
-        print(f"Error pinning tournament: {e}")
+    except Exception:
+        if random.random() < TOGGLE_ERROR_LOG_SAMPLE_RATE:
+            current_app.logger.exception("Error pinning tournament")
         return jsonify({'success': False, 'message': 'An error occurred while pinning the tournament'}), 500
 
 @tournament_bp.route('/<int:tournament_id>/unpin', methods=['POST'])
@@ -240,8 +334,9 @@ def unpin_tournament(tournament_id):
             return jsonify({'success': True})
         return jsonify({'success': False, 'message': 'Tournament was not pinned'}), 400
         
-    except Exception as e:
-        print(f"Error unpinning tournament: {e}")
+    except Exception:
+        if random.random() < TOGGLE_ERROR_LOG_SAMPLE_RATE:
+            current_app.logger.exception("Error unpinning tournament")
         return jsonify({'success': False, 'message': 'An error occurred while unpinning the tournament'}), 500
 
 @tournament_bp.route('/<int:tournament_id>/hide', methods=['POST'])
@@ -271,8 +366,9 @@ def hide_tournament(tournament_id):
         session.modified = True
         return jsonify({'success': True})
         
-    except Exception as e:
-        print(f"Error hiding tournament: {e}")
+    except Exception:
+        if random.random() < TOGGLE_ERROR_LOG_SAMPLE_RATE:
+            current_app.logger.exception("Error hiding tournament")
         return jsonify({'success': False, 'message': 'An error occurred while hiding the tournament'}), 500
 
 # Tournament routes
@@ -287,37 +383,30 @@ def index():
         return redirect("/")
 
     try:
-        # Get tournaments where user is the creator
-        tournaments = db.get_tournaments_by_creator(user_id)
-        
-        # Get shared tournaments from session
-        share_link_tournaments = []
-        for key in list(session.keys()):
+        # Tournaments shared with the user through share links in the session
+        share_link_ids = set()
+        for key in session.keys():
             if key.startswith('share_link_') and key != f'share_link_{user_id}':
                 try:
-                    tournament_id = int(key.split('_')[-1])
-                    tournament = db.get_tournament(tournament_id)
-                    if tournament and not any(t['id'] == tournament_id for t in tournaments):
-                        tournament['via_share_link'] = True
-                        share_link_tournaments.append(tournament)
+                    share_link_ids.add(int(key.split('_')[-1]))
                 except (ValueError, IndexError):
                     continue
         
-        # Combine both lists
-        all_tournaments = tournaments + share_link_tournaments
-        
         # Get hidden tournaments for this user
         hidden_key = f'hidden_tournaments_{user_id}'
         hidden_tournaments = set(session.get(hidden_key, []))
         
-        # Filter out hidden tournaments
-        visible_tournaments = [t for t in all_tournaments if t['id'] not in hidden_tournaments]
+        # Own and shared tournaments, minus hidden ones, in one query
+        visible_tournaments = db.get_user_dashboard_tournaments(
+            user_id, list(share_link_ids), list(hidden_tournaments)
+        )
         
-        return render_template('tournament/index.html', tournaments=visible_tournaments)
-    except Exception as e:
-        print(f"Error retrieving tournaments: {e}")
-        import traceback
-        traceback.print_exc()
+        etag = _page_etag(visible_tournaments, session.get(f'pinned_tournaments_{user_id}'))
+        return _conditional_response(
+            etag, lambda: render_template('tournament/index.html', tournaments=visible_tournaments)
+        )
+    except Exception:
+        current_app.logger.exception("Error retrieving tournaments")
         flash('An error occurred while retrieving your tournaments.', 'error')
         return render_template('tournament/index.html', tournaments=[])
 
@@ -359,8 +448,8 @@ def create():
             else:
                 flash('Failed to create tournament. Please try again.', 'error')
                 
-        except Exception as e:
-            print(f"Error creating tournament: {e}")
+        except Exception:
+            current_app.logger.exception("Error creating tournament")
             flash('An error occurred while creating the tournament. Please try again.', 'error')
     
     # For GET request or if there was an error
@@ -386,7 +475,7 @@ def tournament_settings(tournament_id):
     has_edit_permission = False
     
     if token:
-        is_valid, permissions = validate_share_link(token, tournament_id)
+        is_valid, permissions = validate_share_link_once(token, tournament_id)
         if is_valid and 'can_edit_settings' in permissions:
             has_edit_permission = True
     
@@ -394,7 +483,16 @@ def tournament_settings(tournament_id):
         flash('You do not have permission to edit this tournament.', 'danger')
         return redirect(url_for('tournament.view', tournament_id=tournament_id))
     
-    form = TournamentSettingsForm()
+    if request.method == 'GET':
+        # Pre-populate the form from the tournament in a single pass
+        form = TournamentSettingsForm(obj=SimpleNamespace(**{
+            **SETTINGS_FORM_DEFAULTS,
+            **tournament,
+            'start_date': _as_date_str(tournament.get('start_date')),
+            'end_date': _as_date_str(tournament.get('end_date')),
+        }))
+    else:
+        form = TournamentSettingsForm()
     
     # Handle form submission
     if request.method == 'POST' and form.validate_on_submit():
@@ -425,47 +523,46 @@ def tournament_settings(tournament_id):
                 return redirect(url_for('tournament.view', tournament_id=tournament_id))
             else:
                 flash('Failed to update tournament settings. Please try again.', 'danger')
-        except Exception as e:
-            current_app.logger.error(f"Error updating tournament: {str(e)}")
+        except Exception:
+            current_app.logger.exception("Error updating tournament")
             flash('An error occurred while updating the tournament. Please try again.', 'danger')
     
-    # Pre-populate form for GET request or failed POST
-    if request.method == 'GET':
-        form.name.data = tournament.get('name')
-        form.location.data = tournament.get('location')
-        form.comments.data = tournament.get('comments')
-        
-        # Handle date conversion safely
-        if tournament.get('start_date'):
-            if isinstance(tournament['start_date'], str):
-                form.start_date.data = tournament['start_date'].split()[0]  # Get just the date part
-            else:
-                form.start_date.data = tournament['start_date'].strftime('%Y-%m-%d')
-        
-        if tournament.get('end_date'):
-            if isinstance(tournament['end_date'], str):
-                form.end_date.data = tournament['end_date'].split()[0]  # Get just the date part
-            else:
-                form.end_date.data = tournament['end_date'].strftime('%Y-%m-%d')
-        
-        form.rounds.data = tournament.get('rounds', 5)
-        form.time_control.data = tournament.get('time_control')
-        form.description.data = tournament.get('description')
-        
-        # Set point settings defaults if not set
-        form.win_points.data = tournament.get('win_points', 1.0)
-        form.draw_points.data = tournament.get('draw_points', 0.5)
-        form.loss_points.data = tournament.get('loss_points', 0.0)
-        form.bye_points.data = tournament.get('bye_points', 1.0)
-    
     return render_template(
         'tournament/settings.html',
         tournament=tournament,
         form=form
     )
 
-from admin_share_links import validate_share_link
-import openai
+from admin_share_links import validate_share_link_once
+from collections import defaultdict, deque
+
+# Throttle OpenAI calls per tournament: at most AI_ANALYSIS_MAX_CALLS
+# within AI_ANALYSIS_WINDOW seconds, after which the static summary is served.
+AI_ANALYSIS_MAX_CALLS = 3
+AI_ANALYSIS_WINDOW = 60
+_ai_analysis_calls = defaultdict(deque)
+
+def _ai_call_allowed(tournament_id: int) -> bool:
+    """Record an OpenAI call for the tournament if it is under the rate limit."""
+    now = time.monotonic()
+    calls = _ai_analysis_calls[tournament_id]
+    while calls and now - calls[0] > AI_ANALYSIS_WINDOW:
+        calls.popleft()
+    if len(calls) >= AI_ANALYSIS_MAX_CALLS:
+        return False
+    calls.append(now)
+    return True
+
+def _static_summary(tournament_data: Dict[str, Any], note: str = None) -> str:
+    """Render the markdown summary used when the AI analysis is not requested."""
+    top_players = "\n".join(
+        f"{s['rank']}. {s['name']} ({s['points']} pts)" 
+        for s in tournament_data['standings'][:5]
+    )
+    analysis = f"## Tournament Analysis\n\n### Top Players\n{top_players}"
+    if note:
+        analysis += f"\n\n*Note: {note}*"
+    return analysis
 
 @tournament_bp.route('/<int:tournament_id>/ai-analysis')
 @login_required
@@ -482,13 +579,6 @@ def ai_analysis(tournament_id):
         # Get tournament data
         players = db.get_players(tournament_id)
         rounds = db.get_rounds(tournament_id)
-        pairings = []
-        
-        for round_ in rounds:
-            round_pairings = db.get_pairings(round_['id'])
-            for pairing in round_pairings:
-                pairing['round_number'] = round_['round_number']
-                pairings.append(pairing)
     
         # Get standings and ensure we have valid data
         standings = db.get_standings(tournament_id) or []
@@ -500,32 +590,8 @@ def ai_analysis(tournament_id):
                 'error': 'Not enough tournament data available for analysis'
             })
         
-        # Prepare player name mapping for lookups
-        player_name_map = {p['id']: p['name'] for p in players}
-        
-        # Prepare standings with safe access to fields
-        safe_standings = []
-        for i, s in enumerate(standings, 1):
-            safe_standings.append({
-                'rank': s.get('rank', i),  # Use position in list if rank is missing
-                'name': s.get('name', 'Unknown Player'),
-                'points': s.get('points', 0),
-                'tiebreak1': s.get('tiebreak1', 0),
-                'tiebreak2': s.get('tiebreak2', 0)
-            })
-        
-        # Prepare pairings with safe access to fields
-        safe_pairings = []
-        for p in pairings:
-            white_id = p.get('white_player_id')
-            black_id = p.get('black_player_id')
-            
-            safe_pairings.append({
-                'round': p.get('round_number', 0),
-                'white': player_name_map.get(white_id, 'Unknown') if white_id else 'Bye',
-                'black': player_name_map.get(black_id, 'Unknown') if black_id else 'Bye',
-                'result': p.get('result', 'Not played')
-            })
+        # Only the last few games make it into the prompt, so let SQL pick them
+        recent_pairings = db.get_recent_pairings(tournament_id, limit=10)
         
         # Prepare tournament data
         tournament_data = {
@@ -540,12 +606,23 @@ def ai_analysis(tournament_id):
                 'rating': p.get('rating'),
                 'team': p.get('team_name')
             } for p in players],
-            'standings': safe_standings,
-            'pairings': safe_pairings
+            'standings': standings[:5],
+            'pairings': recent_pairings
         }
         
+        # Nothing interesting to analyze yet, or this tournament has hit the
+        # rate limit: serve the summary without calling the API.
+        if len(rounds) < 2 or all(s['points'] == 0 for s in standings):
+            return jsonify({'success': True, 'analysis': _static_summary(tournament_data)})
+        if not _ai_call_allowed(tournament_id):
+            return jsonify({
+                'success': True,
+                'analysis': _static_summary(tournament_data, 'Detailed AI analysis was generated recently. Please try again in a minute.')
+            })
+        
         # Prepare the prompt for the AI
-        prompt = f"""Analyze this chess tournament data and provide insights:
+        buf = io.StringIO()
+        buf.write(f"""Analyze this chess tournament data and provide insights:
         
 Tournament: {tournament_data['name']}
 Status: {tournament_data['status'].capitalize()}
@@ -553,17 +630,21 @@ Players: {tournament_data['total_players']}
 Rounds: {tournament_data['total_rounds']}
 
 Top Players:
-"""
+""")
         # Add top 5 players to the prompt
-        for i, player in enumerate(tournament_data['standings'][:5], 1):
-            prompt += f"{i}. {player['name']} - {player['points']} points\n"
+        buf.writelines(
+            f"{player['rank']}. {player['name']} - {player['points']} points\n"
+            for player in tournament_data['standings']
+        )
         
-        prompt += "\nRecent Pairings:\n"
+        buf.write("\nRecent Pairings:\n")
         # Add recent pairings to the prompt
-        for pairing in tournament_data['pairings'][-10:]:
-            prompt += f"Round {pairing['round']}: {pairing['white']} vs {pairing['black']} - {pairing['result']}\n"
+        buf.writelines(
+            f"Round {pairing['round_number']}: {pairing['white_name']} vs {pairing['black_name']} - {pairing['result']}\n"
+            for pairing in tournament_data['pairings']
+        )
         
-        prompt += """
+        buf.write("""
         
 Provide a brief analysis of the tournament, including:
 1. Top performers and their performance
@@ -572,11 +653,12 @@ Provide a brief analysis of the tournament, including:
 4. Predictions for the final standings if the tournament is still in progress
 
 Keep the analysis concise and focused on the most interesting aspects.
-"""
+""")
+        prompt = buf.getvalue()
         
         try:
             # Call OpenAI API
-            response = client.chat.completions.create(
+            response = _openai_client().chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[
                     {"role": "system", "content": "You are a chess tournament analyst. Provide insightful and concise analysis of the tournament data."},
@@ -587,14 +669,10 @@ Keep the analysis concise and focused on the most interesting aspects.
             )
             
             analysis = response.choices[0].message.content.strip()
-        except Exception as api_error:
-            print(f"OpenAI API error: {str(api_error)}")
+        except Exception:
+            current_app.logger.exception("OpenAI API error")
             # Fallback to a simple analysis if API call fails
-            top_players = "\n".join(
-                f"{i+1}. {s['name']} ({s['points']} pts)" 
-                for i, s in enumerate(tournament_data['standings'][:5])
-            )
-            analysis = f"## Tournament Analysis\n\n### Top Players\n{top_players}\n\n*Note: Detailed AI analysis is currently unavailable. Please try again later.*"
+            analysis = _static_summary(tournament_data, 'Detailed AI analysis is currently unavailable. Please try again later.')
         
         return jsonify({
             'success': True,
@@ -602,7 +680,7 @@ Keep the analysis concise and focused on the most interesting aspects.
         })
         
     except Exception as e:
-        print(f"Error generating AI analysis: {str(e)}")
+        current_app.logger.exception("Error generating AI analysis")
         return jsonify({
             'success': False,
             'error': f'Error generating analysis: {str(e)}'
@@ -641,26 +719,32 @@ def manage_teams(tournament_id):
                          unassigned_players=unassigned_players,
                          teams=teams)
 
+# Kept as a single constant so sqlite3 reuses its cached prepared statement
+ASSIGN_TEAM_SQL = """
+UPDATE players SET team = ?
+WHERE id = ?
+  AND id IN (SELECT player_id FROM tournament_players WHERE tournament_id = ?)
+"""
+
 @tournament_bp.route('/<int:tournament_id>/assign-team/<int:player_id>', methods=['POST'])
 @login_required
 @get_db
 def assign_team(tournament_id, player_id):
     """Assign a player to a team."""
     db = g.db
-    data = request.get_json()
-    team_name = data.get('team', '').strip()
+    team_name = request.form.get('team', '').strip()
     
     if not team_name:
         return jsonify({'success': False, 'message': 'Team name is required'}), 400
     
     try:
-        # Update player's team
-        db.cursor.execute(
-            "UPDATE players SET team = ? WHERE id = ?",
-            (team_name, player_id)
-        )
+        # Update player's team, only if they belong to this tournament
+        db.cursor.execute(ASSIGN_TEAM_SQL, (team_name, player_id, tournament_id))
         db.conn.commit()
         
+        if db.cursor.rowcount == 0:
+            return jsonify({'success': False, 'message': 'Player not found in this tournament'}), 404
+        
         return jsonify({
             'success': True,
             'message': 'Team assigned successfully'
@@ -723,24 +807,17 @@ def create_random_teams(tournament_id):
             db.cursor.execute("UPDATE players SET team = NULL")
             players_to_assign = db.get_players(tournament_id)
         
-        # Shuffle players randomly
-        random.shuffle(players_to_assign)
+        # Shuffle player ids randomly
+        player_ids = [p['id'] for p in players_to_assign]
+        random.shuffle(player_ids)
         
-        # Create teams
-        team_number = 1
-        for i in range(0, len(players_to_assign), team_size):
-            team_name = f"Team {team_number}"
-            team_players = players_to_assign[i:i + team_size]
-            
-            for player in team_players:
-                db.cursor.execute(
-                    "UPDATE players SET team = ? WHERE id = ?",
-                    (team_name, player['id'])
-                )
-            team_number += 1
+        # Create teams of team_size consecutive players
+        assignments = [(f"Team {1 + i // team_size}", player_id) for i, player_id in enumerate(player_ids)]
+        db.cursor.executemany("UPDATE players SET team = ? WHERE id = ?", assignments)
+        team_count = -(-len(player_ids) // team_size)
         
         db.conn.commit()
-        flash(f'Created {team_number - 1} random teams', 'success')
+        flash(f'Created {team_count} random teams', 'success')
         
     except Exception as e:
         db.conn.rollback()
@@ -752,14 +829,10 @@ def create_random_teams(tournament_id):
 @login_required
 def view(tournament_id):
     """View tournament details."""
-    import logging
-    logging.basicConfig(level=logging.DEBUG)
-    logger = logging.getLogger(__name__)
-    
     try:
         db = get_db()
-        tournament = db.get_tournament(tournament_id)
-        logger.debug(f"Viewing tournament: {tournament}")
+        tournament = cached_tournament(tournament_id)
+        current_app.logger.debug("Viewing tournament: %s", tournament)
         
         # Check if tournament exists
         if not tournament:
@@ -774,18 +847,18 @@ def view(tournament_id):
         share_link_key = f'share_link_{tournament_id}'
         has_valid_share_link = False
         
-        # Check session first
-        if share_link_key in session:
+        # The creator needs no share link; otherwise check the session first
+        if creator_id != user_id and share_link_key in session:
             token = session[share_link_key]
-            is_valid, _ = validate_share_link(token, tournament_id)
+            is_valid, _ = validate_share_link_once(token, tournament_id)
             if is_valid:
                 has_valid_share_link = True
         
         # If no valid session, check URL token
-        if not has_valid_share_link:
+        if creator_id != user_id and not has_valid_share_link:
             token = request.args.get('token')
             if token:
-                is_valid, _ = validate_share_link(token, tournament_id)
+                is_valid, _ = validate_share_link_once(token, tournament_id)
                 if is_valid:
                     # Store the token in session for future requests
                     session[share_link_key] = token
@@ -796,51 +869,42 @@ def view(tournament_id):
             flash('You do not have permission to view this tournament.', 'danger')
             return redirect(url_for('tournament.index'))
             
-        # Get current round and its pairings
-        current_round = db.get_current_round(tournament_id)
-        pairings = []
-        print(current_round)
-        if current_round:
-            pairings = db.get_round_pairings(current_round['id'])
+        # Creator's username and email are joined in by get_tournament
+        creator_username = tournament.get('creator_username') or 'System'
+        creator_email = tournament.get('creator_email')
+        
+        # Every write to the tournament's rounds, pairings, players or byes bumps
+        # its revision, so an unchanged revision means an unchanged page
+        etag = _page_etag(db.get_tournament_revision(tournament_id), creator_username, creator_email)
+        
+        def render():
+            # Get current round and its pairings
+            current_round = cached_current_round(tournament_id)
+            pairings = []
+            if current_round:
+                pairings = db.get_round_pairings(current_round['id'])
+                
+            # Get view type (individual or team)
+            view_type = request.args.get('view', 'individual')
             
-        # Get view type (individual or team)
-        view_type = request.args.get('view', 'individual')
-        
-        # Get standings based on view type
-        logger.debug(f"Getting standings for tournament {tournament_id} with view_type {view_type}")
-        standings = db.get_standings(tournament_id, view_type=view_type)
-        logger.debug(f"Retrieved {len(standings) if standings else 0} standings records")
-        if standings:
-            logger.debug(f"Sample standing: {standings[0]}")
-        else:
-            logger.debug("No standings data returned from get_standings")
-        
-        # Get creator's username and email
-        creator_username = 'System'
-        creator_email = None
-        if tournament.get('creator_id'):
-            from sql import SQL
-            db = SQL("sqlite:///users.db")
-            user = db.execute("SELECT * FROM users WHERE id = :id", id=tournament['creator_id'])
-
-            if user:
-                creator_username = user[0].get("username", 'System')
-                creator_email = user[0].get("email")
-        
-        print(creator_username)
-        from datetime import datetime, timezone
-        
-        return render_template('tournament/view.html', 
-                            tournament=tournament,
-                            current_round=current_round,
-                            pairings=pairings,
-                            standings=standings,
-                            view_type=view_type,
-                            creator_username=creator_username,
-                            creator_email=creator_email,
-                            now=datetime.now(timezone.utc))
-    except Exception as e:
-        print(f"Error viewing tournament {tournament_id}: {e}")
+            # Get standings based on view type
+            standings = db.get_standings(tournament_id, view_type=view_type)
+            current_app.logger.debug("Retrieved %d %s standings records for tournament %s",
+                                     len(standings or ()), view_type, tournament_id)
+            
+            return render_template('tournament/view.html', 
+                                tournament=tournament,
+                                current_round=current_round,
+                                pairings=pairings,
+                                standings=standings,
+                                view_type=view_type,
+                                creator_username=creator_username,
+                                creator_email=creator_email,
+                                now=datetime.now(timezone.utc))
+        
+        return _conditional_response(etag, render)
+    except Exception:
+        current_app.logger.exception("Error viewing tournament %s", tournament_id)
         flash('An error occurred while loading the tournament.', 'error')
         return redirect(url_for('tournament.index'))
 
@@ -920,7 +984,7 @@ def edit_player(tournament_id, player_id):
 def manage_players(tournament_id):
     """Manage tournament players."""
     db = get_db()
-    tournament = db.get_tournament(tournament_id)
+    tournament = cached_tournament(tournament_id)
     if not tournament:
         flash('Tournament not found.', 'danger')
         return redirect(url_for('tournament.index'))
@@ -935,22 +999,20 @@ def manage_players(tournament_id):
                 flash('Player name is required.', 'error')
             else:
                 try:
-                    # Create the new player with current timestamp and optional team
-                    db.cursor.execute(
-                        "INSERT INTO players (name, rating, team, created_at) VALUES (?, ?, ?, datetime('now'))",
-                        (name, rating, team)
-                    )
-                    player_id = db.cursor.lastrowid
+                    # Create the player and add them to the tournament in one transaction
+                    with db.conn:
+                        db.cursor.execute(
+                            "INSERT INTO players (name, rating, team, created_at) VALUES (?, ?, ?, datetime('now'))",
+                            (name, rating, team)
+                        )
+                        player_id = db.cursor.lastrowid
+                        added = db.add_player_to_tournament(tournament_id, player_id, commit=False)
                     
-                    # Add the new player to the tournament
-                    if db.add_player_to_tournament(tournament_id, player_id):
+                    if added:
                         flash(f'Player {name} created and added to tournament!', 'success')
                     else:
                         flash(f'Player {name} was created but could not be added to the tournament.', 'warning')
-                    
-                    db.conn.commit()
                 except sqlite3.Error as e:
-                    db.conn.rollback()
                     print(f"Error creating player: {e}")
                     flash('An error occurred while creating the player.', 'error')
                     
@@ -970,13 +1032,9 @@ def manage_players(tournament_id):
                 else:
                     flash('Failed to remove player from tournament.', 'error')
     
-    # Get all players and tournament players
-    all_players = db.get_all_players()
+    # Get tournament players and the players that can still be added
     tournament_players = db.get_tournament_players(tournament_id)
-    
-    # Get player IDs already in the tournament for filtering
-    tournament_player_ids = {p['id'] for p in tournament_players}
-    available_players = [p for p in all_players if p['id'] not in tournament_player_ids]
+    available_players = db.get_available_players(tournament_id)
     
     return render_template('tournament/manage_players.html',
                          tournament=tournament,
@@ -1028,6 +1086,21 @@ class TournamentSettingsForm(FlaskForm):
                 
         return True
 
+# Values used for settings the tournament row does not define
+SETTINGS_FORM_DEFAULTS = {
+    'rounds': 5,
+    'win_points': 1.0,
+    'draw_points': 0.5,
+    'loss_points': 0.0,
+    'bye_points': 1.0,
+}
+
+def _as_date_str(value):
+    """Return a stored date or datetime as the YYYY-MM-DD string the settings form uses."""
+    if not value:
+        return value
+    return value.split()[0] if isinstance(value, str) else value.strftime('%Y-%m-%d')
+
 # Form for generating pairings
 class PairingsForm(FlaskForm):
     pairing_method = SelectField('Pairing Method', 
@@ -1052,7 +1125,7 @@ def manage_byes(tournament_id):
     """Manage byes for a tournament."""
     try:
         db = get_db()
-        tournament = db.get_tournament(tournament_id)
+        tournament = cached_tournament(tournament_id)
         if not tournament:
             flash('Tournament not found.', 'error')
             return redirect(url_for('tournament.index'))
@@ -1070,43 +1143,19 @@ def manage_byes(tournament_id):
         form.player_id.choices = [(p['id'], f"{p['name']} ({p.get('rating', 'Unrated')})") 
                                 for p in players]
         
-        # Get all rounds and their pairings to determine completion status
-        db.cursor.execute("""
-            SELECT r.id, r.round_number, 
-                   COUNT(p.id) as total_pairings,
-                   SUM(CASE WHEN p.result IS NOT NULL AND p.result != '' THEN 1 ELSE 0 END) as completed_pairings
-            FROM rounds r
-            LEFT JOIN pairings p ON r.id = p.round_id
-            WHERE r.tournament_id = ?
-            GROUP BY r.id, r.round_number
-            ORDER BY r.round_number
-        """, (tournament_id,))
-        rounds_info = {}
-        for r in db.cursor.fetchall():
-            # A round is considered completed if it has pairings and all have results
-            rounds_info[r['round_number']] = (r['total_pairings'] > 0 and 
-                                            r['completed_pairings'] == r['total_pairings'])
+        # Completion status of every round, and the current round, in one query
+        round_completion = db.get_round_completion(tournament_id)
+        rounds_info = {r['round_number']: bool(r['is_completed']) for r in round_completion}
+        current_round_num = next(
+            (r['round_number'] for r in round_completion if r['is_current']), 1
+        )
         
-        # Get current round info
-        current_round = db.get_current_round(tournament_id)
-        current_round_num = current_round['round_number'] if current_round else 1
-        
-        # Only show future rounds and current round if it's not completed
-        available_rounds = []
-        for i in range(1, tournament['rounds'] + 1):
-            # If we have info about this round, check if it's completed
-            if i in rounds_info:
-                if not rounds_info[i]:  # If round is not completed
-                    available_rounds.append((i, f"Round {i}"))
-            # If we don't have info, it's a future round
-            elif i >= current_round_num:
-                available_rounds.append((i, f"Round {i}"))
-        
-        form.round_number.choices = available_rounds
-        
-        # Get current round info for the template
-        current_round = db.get_current_round(tournament_id)
-        current_round_num = current_round['round_number'] if current_round else 1
+        # Only show future rounds and current round if it's not completed;
+        # rounds without info are future rounds
+        form.round_number.choices = [
+            (i, f"Round {i}") for i in range(1, tournament['rounds'] + 1)
+            if (not rounds_info[i] if i in rounds_info else i >= current_round_num)
+        ]
         
         return render_template('tournament/manage_byes.html',
                              tournament=tournament,
@@ -1114,8 +1163,8 @@ def manage_byes(tournament_id):
                              byes=byes,
                              form=form,
                              current_round_num=current_round_num)
-    except Exception as e:
-        print(f"Error managing byes: {e}")
+    except Exception:
+        current_app.logger.exception("Error managing byes")
         flash('An error occurred while loading the bye management page.', 'error')
         return redirect(url_for('tournament.view', tournament_id=tournament_id))
 
@@ -1129,7 +1178,7 @@ def assign_bye(tournament_id):
         
     db = get_db()
     try:
-        tournament = db.get_tournament(tournament_id)
+        tournament = cached_tournament(tournament_id)
         if not tournament:
             flash('Tournament not found.', 'error')
             return redirect(url_for('tournament.index'))
@@ -1142,7 +1191,7 @@ def assign_bye(tournament_id):
             return redirect(url_for('tournament.manage_byes', tournament_id=tournament_id))
         
         # Check if the round has already been completed
-        current_round = db.get_current_round(tournament_id)
+        current_round = cached_current_round(tournament_id)
         if current_round and round_number < current_round['round_number']:
             flash('Cannot assign a bye to a completed round.', 'error')
             return redirect(url_for('tournament.manage_byes', tournament_id=tournament_id))
@@ -1154,11 +1203,12 @@ def assign_bye(tournament_id):
             return redirect(url_for('tournament.manage_byes', tournament_id=tournament_id))
             
         # Get current round info
-        current_round = db.get_current_round(tournament_id)
+        current_round = cached_current_round(tournament_id)
         current_round_num = current_round['round_number'] if current_round else 0
         
         # Assign the bye
         if db.assign_manual_bye(tournament_id, player_id, round_number, session['user_id']):
+            invalidate_tournament_cache(tournament_id)
             # If this is the current round, regenerate pairings
             if round_number == current_round_num and current_round:
                 if regenerate_current_round_pairings(db, tournament_id):
@@ -1171,7 +1221,7 @@ def assign_bye(tournament_id):
             flash('Failed to assign bye. Please try again.', 'error')
         
     except Exception as e:
-        print(f"Error assigning bye: {e}")
+        current_app.logger.exception("Error assigning bye")
         flash(f'An error occurred while assigning the bye: {str(e)}', 'error')
     
     return redirect(url_for('tournament.manage_byes', tournament_id=tournament_id))
@@ -1186,7 +1236,7 @@ def remove_bye(tournament_id, bye_id):
         
     db = get_db()
     try:
-        tournament = db.get_tournament(tournament_id)
+        tournament = cached_tournament(tournament_id)
         if not tournament:
             flash('Tournament not found.', 'error')
             return redirect(url_for('tournament.index'))
@@ -1204,29 +1254,18 @@ def remove_bye(tournament_id, bye_id):
             return redirect(url_for('tournament.manage_byes', tournament_id=tournament_id))
         
         # Get round completion status by checking pairings
-        db.cursor.execute("""
-            SELECT r.id, r.round_number, 
-                   COUNT(p.id) as total_pairings,
-                   SUM(CASE WHEN p.result IS NOT NULL AND p.result != '' THEN 1 ELSE 0 END) as completed_pairings
-            FROM rounds r
-            LEFT JOIN pairings p ON r.id = p.round_id
-            WHERE r.tournament_id = ? AND r.round_number = ?
-            GROUP BY r.id, r.round_number
-        """, (tournament_id, bye['round_number']))
-        
-        round_info = db.cursor.fetchone()
+        round_info = next(iter(db.get_round_completion(tournament_id, bye['round_number'])), None)
         
         if round_info:
             # Check if the round is completed (all pairings have results)
-            is_round_completed = (round_info['total_pairings'] > 0 and 
-                                round_info['completed_pairings'] == round_info['total_pairings'])
+            is_round_completed = bool(round_info['is_completed'])
             
             if is_round_completed:
                 flash('Cannot remove byes from rounds that have been completed.', 'error')
                 return redirect(url_for('tournament.manage_byes', tournament_id=tournament_id))
                 
 # Check if this is a past round (earlier than current round)
-            current_round = db.get_current_round(tournament_id)
+            current_round = cached_current_round(tournament_id)
             current_round_num = current_round['round_number'] if current_round else 1
             
             if bye['round_number'] < current_round_num:
@@ -1234,11 +1273,12 @@ def remove_bye(tournament_id, bye_id):
                 return redirect(url_for('tournament.manage_byes', tournament_id=tournament_id))
         
         # Get current round info
-        current_round = db.get_current_round(tournament_id)
+        current_round = cached_current_round(tournament_id)
         current_round_num = current_round['round_number'] if current_round else 0
         
         # Remove the bye
         if db.remove_manual_bye(bye_id):
+            invalidate_tournament_cache(tournament_id)
             # If this is the current round, regenerate pairings
             if bye['round_number'] == current_round_num and current_round:
                 if regenerate_current_round_pairings(db, tournament_id):
@@ -1251,45 +1291,76 @@ def remove_bye(tournament_id, bye_id):
             flash('Failed to remove bye. Please try again.', 'error')
         
     except Exception as e:
-        print(f"Error removing bye: {e}")
+        current_app.logger.exception("Error removing bye")
         flash(f'An error occurred while removing the bye: {str(e)}', 'error')
     
     return redirect(url_for('tournament.manage_byes', tournament_id=tournament_id))
 
+class _Record:
+    """Fixed-attribute view of a database row for dot access in templates."""
+    __slots__ = ()
+    
+    def __init__(self, data):
+        for field in self.__slots__:
+            setattr(self, field, data.get(field))
+
+class _Tournament(_Record):
+    __slots__ = ('id', 'name', 'rounds', 'status', 'creator_id', 'start_date', 'end_date')
+
+class _Round(_Record):
+    __slots__ = ('id', 'tournament_id', 'round_number', 'status', 'is_completed', 'start_time', 'end_time')
+
+def _advance_to_next_round(db, tournament, current_round, method='swiss'):
+    """Start the round after current_round, assign its requested byes and pair it.
+    
+    A round whose pairings could not be generated is removed again.
+    
+    Returns:
+        Tuple of (success, next_round_num)
+    """
+    next_round_num = current_round['round_number'] + 1
+    db.start_round(tournament.id, next_round_num)
+    invalidate_tournament_cache(tournament.id)
+    next_round = cached_current_round(tournament.id)
+    
+    # Process any bye requests for the new round
+    players_needing_byes = db.get_players_with_bye_requests(tournament.id, next_round_num)
+    if db.create_pairings_bulk(next_round['id'], [(player['player_id'], None, 0) for player in players_needing_byes]):  # Board 0 for byes
+        for player in players_needing_byes:
+            flash(f'Assigned bye to {player["name"]} for round {next_round_num}', 'info')
+    
+    # Generate pairings for the remaining players
+    success = db.generate_pairings(tournament.id, next_round['id'], method=method)
+    if not success:
+        db.cursor.execute('DELETE FROM rounds WHERE id = ?', (next_round['id'],))
+        db.conn.commit()
+        invalidate_tournament_cache(tournament.id)
+    
+    return success, next_round_num
+
 @tournament_bp.route('/<int:tournament_id>/pairings', methods=['GET', 'POST'])
 @login_required
 @check_tournament_active
 def manage_pairings(tournament_id):
     """Manage tournament pairings."""
     db = get_db()
-    tournament = db.get_tournament(tournament_id)
+    tournament = cached_tournament(tournament_id)
     if not tournament:
         flash('Tournament not found.', 'danger')
         return redirect(url_for('tournament.index'))
     
-    # Ensure tournament is a dictionary
+    # Dot access for the template
     if isinstance(tournament, dict):
-        tournament = SimpleNamespace(**tournament)
+        tournament = _Tournament(tournament)
     
-    current_round = db.get_current_round(tournament_id)
+    current_round = cached_current_round(tournament_id)
     form = PairingsForm()
     
-    # Load pairings for the current round if it exists
-    pairings = []
-    if current_round:
-        pairings = db.get_pairings(current_round.get('id'))
-    
     # Get players and current byes for the batch byes modal
     players = db.get_tournament_players(tournament_id)
-    current_byes = set()
-    
-    if current_round:
-        # Get manual byes for the current round
-        byes = db.conn.execute(
-            "SELECT player_id FROM manual_byes WHERE tournament_id = ? AND round_number = ?",
-            (tournament_id, current_round['round_number'])
-        ).fetchall()
-        current_byes = {bye['player_id'] for bye in byes}
+    # Manual byes for the current round come with the round itself
+    bye_player_ids = current_round.get('bye_player_ids') if current_round else None
+    current_byes = set(map(int, bye_player_ids.split(','))) if bye_player_ids else set()
     
     # Handle form submission for completing the current round
     if request.method == 'POST' and 'complete_round' in request.form:
@@ -1299,13 +1370,13 @@ def manage_pairings(tournament_id):
             return redirect(url_for('tournament.manage_pairings', tournament_id=tournament_id))
             
         # Verify all results are in
-        all_results_in = all(p.get('result') for p in pairings if p.get('black_player_id') is not None)
-        if not all_results_in:
+        if db.round_has_missing_results(current_round['id']):
             flash('Cannot complete round: not all results have been recorded.', 'warning')
             return redirect(url_for('tournament.manage_pairings', tournament_id=tournament_id))
             
         # Mark current round as completed
         db.complete_round(current_round['id'])
+        invalidate_tournament_cache(tournament_id)
         current_round_num = current_round['round_number']
         
         # If this was the last round, redirect to standings
@@ -1314,33 +1385,16 @@ def manage_pairings(tournament_id):
             return redirect(url_for('tournament.standings', tournament_id=tournament_id))
             
         # Check if we have enough players to generate pairings before creating the next round
-        players = db.get_tournament_players(tournament_id)
         if len(players) < 2:
             flash('Cannot generate pairings: At least 2 players are required to generate pairings.', 'error')
             return redirect(url_for('tournament.manage_pairings', tournament_id=tournament_id))
             
-        # Create next round only if we have enough players
-        next_round_num = current_round_num + 1
-        db.start_round(tournament_id, next_round_num)
-        next_round = db.get_current_round(tournament_id)
-        
-        # Process any bye requests for the new round
-        players_needing_byes = db.get_players_with_bye_requests(tournament_id, next_round_num)
-        for player in players_needing_byes:
-            db.create_pairing(next_round['id'], player['player_id'], None, 0)  # Board 0 for byes
-            flash(f'Assigned bye to {player["name"]} for round {next_round_num}', 'info')
-            
-        # Generate pairings for the remaining players
-        method = 'swiss'  # Default to Swiss system
-        success = db.generate_pairings(tournament_id, next_round['id'], method=method)
-        
+        # Create the next round and pair it (Swiss by default)
+        success, next_round_num = _advance_to_next_round(db, tournament, current_round)
         if success:
             flash(f'Round {next_round_num} has been created and pairings generated!', 'success')
         else:
             flash('Failed to generate pairings for the next round.', 'danger')
-            # If we fail to generate pairings, we should clean up the round we just created
-            db.conn.execute('DELETE FROM rounds WHERE id = ?', (next_round['id'],))
-            db.conn.commit()
             
         return redirect(url_for('tournament.manage_pairings', tournament_id=tournament_id))
         
@@ -1350,13 +1404,21 @@ def manage_pairings(tournament_id):
             # If no current round, create the first round
             round_num = 1
             db.start_round(tournament_id, round_num)
-            current_round = db.get_current_round(tournament_id)
+            invalidate_tournament_cache(tournament_id)
+            current_round = cached_current_round(tournament_id)
             if not current_round:
                 flash('Failed to create a new round.', 'danger')
                 return redirect(url_for('tournament.manage_pairings', tournament_id=tournament_id))
         
-        # Generate pairings using the selected method
+        # A re-post with the same method, roster and byes would only repeat the
+        # work; random pairings differ on every run, so those are always redone
         method = form.pairing_method.data
+        byes_signature = cached_pairing_signature(tournament_id, current_round['round_number'])
+        if method != 'random' and db.pairings_already_generated(current_round['id'], method, byes_signature):
+            flash('Pairings for this round have already been generated.', 'info')
+            return redirect(url_for('tournament.manage_pairings', tournament_id=tournament_id))
+        
+        # Generate pairings using the selected method
         success = db.generate_pairings(
             tournament_id,
             current_round['id'],
@@ -1364,67 +1426,37 @@ def manage_pairings(tournament_id):
         )
         
         if success:
+            db.log_pairing_generation(current_round['id'], method, byes_signature)
             flash(f'Pairings generated successfully using {method} method!', 'success')
         else:
             flash('Failed to generate pairings. Please try again.', 'danger')
         
         return redirect(url_for('tournament.manage_pairings', tournament_id=tournament_id))
-    
-    # Ensure pairings are loaded for the current round
-    pairings = []
-    if current_round:
-        pairings = db.get_pairings(current_round.get('id'))
         
     # Handle round completion and next round generation
     elif (request.args.get('generate_next') == 'True' or request.args.get('complete_round') == 'True') and current_round:
         # If completing the current round, verify all results are in
         if request.args.get('complete_round') == 'True':
-            all_results_in = all(p.get('result') for p in pairings if p.get('black_player_id') is not None)
-            if not all_results_in:
+            if db.round_has_missing_results(current_round['id']):
                 flash('Cannot complete round: not all results have been recorded.', 'warning')
                 return redirect(url_for('tournament.manage_pairings', tournament_id=tournament_id))
             
             # Mark current round as completed
             db.complete_round(current_round['id'])
+            invalidate_tournament_cache(tournament_id)
             flash(f'Round {current_round["round_number"]} has been completed successfully!', 'success')
             
             # If this was the last round, redirect to standings
             if current_round['round_number'] >= tournament.rounds:
                 flash('Tournament has been completed!', 'success')
                 return redirect(url_for('tournament.standings', tournament_id=tournament_id))
-            
-            # If not the last round, proceed to generate next round
-            next_round_num = current_round['round_number'] + 1
-        else:
-            # For direct next round generation (backward compatibility)
-            next_round_num = current_round['round_number'] + 1
         
         # Create new round if we haven't reached the maximum
-        if next_round_num > tournament.rounds:
+        if current_round['round_number'] >= tournament.rounds:
             flash('Tournament has reached the maximum number of rounds.', 'warning')
             return redirect(url_for('tournament.standings', tournament_id=tournament_id))
             
-        # Create new round
-        db.start_round(tournament_id, next_round_num)
-        current_round = db.get_current_round(tournament_id)
-        
-        # Process any bye requests for this round
-        players_needing_byes = db.get_players_with_bye_requests(tournament_id, next_round_num)
-        for player in players_needing_byes:
-            db.create_pairing(current_round['id'], player['player_id'], None, 0)  # Board 0 for byes
-            flash(f'Assigned bye to {player["name"]} for round {next_round_num}', 'info')
-        
-        # Generate pairings for the remaining players using the selected method
-        method = 'swiss'  # Default to Swiss system
-        if hasattr(request, 'form') and request.form.get('pairing_method'):
-            method = request.form.get('pairing_method')
-            
-        success = db.generate_pairings(
-            tournament_id,
-            current_round['id'],
-            method=method
-        )
-        
+        success, next_round_num = _advance_to_next_round(db, tournament, current_round)
         if success:
             flash(f'Round {next_round_num} has been created and pairings generated!', 'success')
         else:
@@ -1432,22 +1464,21 @@ def manage_pairings(tournament_id):
             
         return redirect(url_for('tournament.manage_pairings', tournament_id=tournament_id))
     
+    # Only the rendered page needs the pairings themselves
+    pairings = db.get_pairings(current_round.get('id')) if current_round else []
+    
     # Ensure current_round is properly formatted for the template
-    pairings = []
     current_round_obj = None
     
     if current_round:
-        pairings = db.get_pairings(current_round.get('id'))
         # Ensure all required fields are present
         current_round.setdefault('round_number', 0)
         # Create a copy of the dictionary to avoid modifying the original
         round_data = dict(current_round)
         # Ensure is_completed is set
         round_data['is_completed'] = bool(round_data.get('is_completed', 0))
-        # Convert to SimpleNamespace for dot notation in template
-        current_round_obj = SimpleNamespace(**round_data)
-    
-    from datetime import datetime
+        # Wrap for dot notation in template
+        current_round_obj = _Round(round_data)
     
     return render_template(
         'tournament/pairings.html',
@@ -1473,7 +1504,7 @@ def swap_players(tournament_id):
     db = get_db()
     
     # Get current round
-    current_round = db.get_current_round(tournament_id)
+    current_round = cached_current_round(tournament_id)
     if not current_round:
         return jsonify({'success': False, 'message': 'No active round found'}), 400
         
@@ -1506,72 +1537,56 @@ def swap_players(tournament_id):
             (player2_color == 'black' and pairing2['black_player_id'] != player2_id)):
             return jsonify({'success': False, 'message': 'Invalid player selection'}), 400
         
-        # Swap the players
-        with db.conn:  # Start a transaction
-            # Update first pairing
-            if player1_color == 'white':
-                db.cursor.execute(
-                    "UPDATE pairings SET white_player_id = ? WHERE id = ?",
-                    (player2_id, pairing1['id'])
-                )
-            else:
-                db.cursor.execute(
-                    "UPDATE pairings SET black_player_id = ? WHERE id = ?",
-                    (player2_id, pairing1['id'])
-                )
-            
-            # Update second pairing
-            if player2_color == 'white':
-                db.cursor.execute(
-                    "UPDATE pairings SET white_player_id = ? WHERE id = ?",
-                    (player1_id, pairing2['id'])
-                )
-            else:
-                db.cursor.execute(
-                    "UPDATE pairings SET black_player_id = ? WHERE id = ?",
-                    (player1_id, pairing2['id'])
-                )
-            
-            # Clear any existing results for these pairings
-            db.cursor.execute(
-                "UPDATE pairings SET result = NULL WHERE id IN (?, ?)",
-                (pairing1['id'], pairing2['id'])
-            )
-        
-        return jsonify({
-            'success': True,
-            'message': 'Players swapped successfully',
-            'pairing1_white': pairing1['white_player_id'] if player1_color != 'white' else player2_id,
-            'pairing1_black': pairing1['black_player_id'] if player1_color != 'black' else player2_id,
-            'pairing2_white': pairing2['white_player_id'] if player2_color != 'white' else player1_id,
-            'pairing2_black': pairing2['black_player_id'] if player2_color != 'black' else player1_id
-        })
+        # Work out both pairings' new players; pairing1 and pairing2 may be the
+        # same board when swapping colours
+        slots = {
+            pairing['id']: {'white': pairing['white_player_id'], 'black': pairing['black_player_id']}
+            for pairing in (pairing1, pairing2)
+        }
+        slots[pairing1['id']]['white' if player1_color == 'white' else 'black'] = player2_id
+        slots[pairing2['id']]['white' if player2_color == 'white' else 'black'] = player1_id
+        new1, new2 = slots[pairing1['id']], slots[pairing2['id']]
         
-        if black1 and black2:
-            db.cursor.execute(
-                "UPDATE pairings SET black_player_id = ? WHERE id = ?",
-                (black2, pairing1['id'])
-            )
-            db.cursor.execute(
-                "UPDATE pairings SET black_player_id = ? WHERE id = ?",
-                (black1, pairing2['id'])
-            )
+        # Swapping a player with themselves changes nothing; don't rewrite the
+        # rows or throw away their results
+        if player1_id == player2_id:
+            return jsonify({
+                'success': True,
+                'message': 'Players swapped successfully',
+                'pairing1_white': new1['white'],
+                'pairing1_black': new1['black'],
+                'pairing2_white': new2['white'],
+                'pairing2_black': new2['black']
+            })
         
-        db.conn.commit()
+        with _write_lock:
+            # Swap the players and clear both results in one statement, taking the
+            # write lock up front so the transaction never has to upgrade from a read lock
+            db.cursor.execute('BEGIN IMMEDIATE')
+            db.cursor.execute("""
+                UPDATE pairings
+                SET white_player_id = CASE WHEN id = ? THEN ? ELSE ? END,
+                    black_player_id = CASE WHEN id = ? THEN ? ELSE ? END,
+                    result = NULL
+                WHERE id IN (?, ?)
+                RETURNING id, white_player_id, black_player_id
+            """, (pairing1['id'], new1['white'], new2['white'],
+                  pairing1['id'], new1['black'], new2['black'],
+                  pairing1['id'], pairing2['id']))
+            stored = {row['id']: row for row in db.cursor.fetchall()}
+            # The round no longer holds the pairings its last generation produced
+            db.cursor.execute("DELETE FROM pairing_generation_log WHERE round_id = ?", (current_round['id'],))
+            db.conn.commit()
         
+        # Report the rows as stored
+        stored1, stored2 = stored[pairing1['id']], stored[pairing2['id']]
         return jsonify({
             'success': True,
             'message': 'Players swapped successfully',
-            'pairing1': {
-                'id': pairing1['id'],
-                'white_player_id': white2 if white1 and white2 else pairing1['white_player_id'],
-                'black_player_id': black2 if black1 and black2 else pairing1['black_player_id']
-            },
-            'pairing2': {
-                'id': pairing2['id'],
-                'white_player_id': white1 if white1 and white2 else pairing2['white_player_id'],
-                'black_player_id': black1 if black1 and black2 else pairing2['black_player_id']
-            }
+            'pairing1_white': stored1['white_player_id'],
+            'pairing1_black': stored1['black_player_id'],
+            'pairing2_white': stored2['white_player_id'],
+            'pairing2_black': stored2['black_player_id']
         })
     except Exception as e:
         db.conn.rollback()
@@ -1582,8 +1597,7 @@ def swap_players(tournament_id):
 @get_db
 def submit_result(tournament_id, pairing_id):
     """Submit a game result."""
-    print(f"Received request to submit result for tournament {tournament_id}, pairing {pairing_id}")
-    print(f"Form data: {request.form}")
+    current_app.logger.debug("Received result for tournament %s, pairing %s", tournament_id, pairing_id)
     
     try:
         db = g.db
@@ -1597,7 +1611,7 @@ def submit_result(tournament_id, pairing_id):
             from flask_wtf.csrf import validate_csrf
             validate_csrf(csrf_token)
         except Exception as e:
-            print(f"CSRF validation error: {str(e)}")
+            current_app.logger.debug("CSRF validation error: %s", e)
             return jsonify({
                 'success': False,
                 'message': 'Invalid or expired security token. Please refresh the page and try again.',
@@ -1605,7 +1619,7 @@ def submit_result(tournament_id, pairing_id):
             }), 403
         
         # Check if the tournament exists and user has access
-        tournament = db.get_tournament(tournament_id)
+        tournament = cached_tournament(tournament_id)
         if not tournament:
             return jsonify({
                 'success': False,
@@ -1613,23 +1627,14 @@ def submit_result(tournament_id, pairing_id):
             }), 404
             
         # Check if the current user is the tournament creator or admin
-        if tournament['creator_id'] != session.get('user_id') and not session.get('is_admin', False):
+        if tournament['creator_id'] != g.user_id and not g.is_admin:
             return jsonify({
                 'success': False,
                 'message': 'You are not authorized to record results for this tournament.'
             }), 403
         
         # Check if the pairing exists and belongs to this tournament
-        pairing = db.cursor.execute(
-            """
-            SELECT p.* 
-            FROM pairings p
-            JOIN rounds r ON p.round_id = r.id
-            WHERE p.id = ? AND r.tournament_id = ?
-            """, (pairing_id, tournament_id)
-        ).fetchone()
-        
-        if not pairing:
+        if not db.pairing_in_tournament(pairing_id, tournament_id):
             return jsonify({
                 'success': False,
                 'message': 'Pairing not found in this tournament.'
@@ -1637,7 +1642,7 @@ def submit_result(tournament_id, pairing_id):
         
         # Record the result
         result_to_save = result if result != '*' else None
-        print(f"Attempting to record result: {result_to_save}")
+        current_app.logger.debug("Attempting to record result: %s", result_to_save)
         
         try:
             success = db.record_result(pairing_id, result_to_save)
@@ -1648,24 +1653,16 @@ def submit_result(tournament_id, pairing_id):
                     'error': 'record_failed'
                 }), 500
                 
-            # Generate a new CSRF token for the next request
-            new_csrf_token = generate_csrf()
-            session['csrf_token'] = new_csrf_token
-            
-            # Make sure the session is saved
-            session.modified = True
-            
+            # The session token stays valid, so hand the submitted one back
+            # instead of rotating it and rewriting the session
             return jsonify({
                 'success': True,
                 'message': 'Result recorded successfully!',
-                'new_csrf_token': new_csrf_token
+                'new_csrf_token': csrf_token
             })
             
         except Exception as e:
-            error_msg = f"Error in record_result: {str(e)}"
-            print(error_msg)
-            import traceback
-            traceback.print_exc()
+            current_app.logger.exception("Error in record_result")
             return jsonify({
                 'success': False,
                 'message': 'An error occurred while recording the result.',
@@ -1674,94 +1671,98 @@ def submit_result(tournament_id, pairing_id):
             }), 500
             
     except sqlite3.Error as e:
-        error_msg = f"Database error recording result: {str(e)}"
-        print(error_msg)
+        current_app.logger.exception("Database error recording result")
         return jsonify({
             'success': False,
             'message': 'A database error occurred while recording the result.',
             'error': str(e)
         }), 500
     except Exception as e:
-        error_msg = f"Unexpected error: {str(e)}"
-        print(error_msg)
-        import traceback
-        traceback.print_exc()
+        current_app.logger.exception("Unexpected error recording result")
         return jsonify({
             'success': False,
             'message': str(e) or 'An error occurred while recording the result.',
             'error': str(e)
         }), 500
 
+# Fields the standings templates expect on every entry
+STANDINGS_DEFAULTS = {
+    'points': 0,
+    'buchholz': 0,
+    'sonneborn_berger': 0,
+    'rating': 0,
+    'team': '',
+}
+
 @tournament_bp.route('/<int:tournament_id>/standings')
 @login_required
 def standings(tournament_id):
     """View tournament standings."""
     try:
         db = get_db()
-        tournament = db.get_tournament(tournament_id)
+        tournament = cached_tournament(tournament_id)
         if not tournament:
             flash('Tournament not found.', 'danger')
             return redirect(url_for('tournament.index'))
         
-        # Check if this is a print view
-        print_view = request.args.get('print') == '1'
-        
-        # Get the view type (team or individual)
-        view_type = request.args.get('view', 'player')
+        # Standings only change when the tournament's revision does
+        etag = _page_etag(db.get_tournament_revision(tournament_id))
         
-        # Get the standings based on view type
-        if view_type == 'team':
-            standings_data = db.get_team_standings(tournament_id)
-            template_name = 'team_standings.html'
-        else:
-            standings_data = db.get_player_standings(tournament_id)
-            template_name = 'standings.html'
-        
-        if not standings_data:
-            flash('No standings data available yet.', 'info')
-            return redirect(url_for('tournament.view', tournament_id=tournament_id))
-        
-        # Add position numbers and format data
-        for i, entry in enumerate(standings_data, 1):
-            entry['position'] = i
-            # Ensure all required fields have default values
-            entry.setdefault('points', 0)
-            entry.setdefault('buchholz', 0)
-            entry.setdefault('sonneborn_berger', 0)
-            entry.setdefault('rating', 0)
-            entry.setdefault('team', '')
-        
-        # Get the current round number for display
-        current_round = db.get_current_round(tournament_id)
-        current_round_num = current_round['round_number'] if current_round else 0
-        
-        # Get current datetime for print view
-        from datetime import datetime
-        now = datetime.utcnow()
-        
-        if print_view:
+        def render():
+            # Check if this is a print view
+            print_view = request.args.get('print') == '1'
+            
+            # Get the view type (team or individual)
+            view_type = request.args.get('view', 'player')
+            
+            # Get the standings based on view type
+            if view_type == 'team':
+                standings_data = db.get_team_standings(tournament_id)
+                template_name = 'team_standings.html'
+            else:
+                standings_data = db.get_player_standings(tournament_id)
+                template_name = 'standings.html'
+            
+            if not standings_data:
+                flash('No standings data available yet.', 'info')
+                return redirect(url_for('tournament.view', tournament_id=tournament_id))
+            
+            # Add position numbers and default values for any missing fields
+            standings_data = [
+                {**STANDINGS_DEFAULTS, **entry, 'position': i}
+                for i, entry in enumerate(standings_data, 1)
+            ]
+            
+            # Get the current round number for display
+            current_round = db.get_current_round(tournament_id)
+            current_round_num = current_round['round_number'] if current_round else 0
+            
+            # Get current datetime for print view
+            now = datetime.utcnow()
+            
+            if print_view:
+                return render_template(
+                    'tournament/print_standings.html',
+                    tournament=tournament,
+                    standings=standings_data,
+                    current_round=current_round_num,
+                    view_type=view_type,
+                    now=now
+                )
+                
             return render_template(
-                'tournament/print_standings.html',
+                f'tournament/{template_name}',
                 tournament=tournament,
                 standings=standings_data,
-                current_round=current_round_num,
                 view_type=view_type,
+                current_round=current_round_num,
                 now=now
             )
-            
-        return render_template(
-            f'tournament/{template_name}',
-            tournament=tournament,
-            standings=standings_data,
-            view_type=view_type,
-            current_round=current_round_num,
-            now=now
-        )
         
-    except Exception as e:
-        print(f"Error in standings route: {e}")
-        import traceback
-        traceback.print_exc()
+        return _conditional_response(etag, render)
+        
+    except Exception:
+        current_app.logger.exception("Error in standings route")
         flash('An error occurred while loading the standings.', 'error')
         return redirect(url_for('tournament.view', tournament_id=tournament_id))
         return redirect(url_for('tournament.view', tournament_id=tournament_id))
@@ -1772,7 +1773,7 @@ def rounds(tournament_id):
     """View and manage all rounds in the tournament."""
     try:
         db = get_db()
-        tournament = db.get_tournament(tournament_id)
+        tournament = cached_tournament(tournament_id)
         if not tournament:
             flash('Tournament not found.', 'danger')
             return redirect(url_for('tournament.index'))
@@ -1819,10 +1820,8 @@ def rounds(tournament_id):
             rounds=rounds_data,
             prize_winners=[]
         )
-    except Exception as e:
-        print(f"Error in rounds route: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        current_app.logger.exception("Error in rounds route")
         flash('An error occurred while processing your request.', 'error')
         return redirect(url_for('tournament.view', tournament_id=tournament_id))
 
@@ -1839,24 +1838,10 @@ def view_round(round_id):
         flash('Round not found.', 'danger')
         return redirect(url_for('tournament.index'))
     
-    tournament = db.get_tournament(round_data['tournament_id'])
+    tournament = cached_tournament(round_data['tournament_id'])
+    # get_pairings joins in both players' names and ratings
     pairings = db.get_pairings(round_id)
     
-    # Get player details for each pairing
-    for pairing in pairings:
-        # The get_pairings method already includes player names and ratings
-        # So we don't need to fetch them again
-        if 'white_name' not in pairing and 'white_player_id' in pairing and pairing['white_player_id']:
-            white = db.get_player(pairing['white_player_id'])
-            if white:
-                pairing['white_name'] = white.get('name', 'Unknown')
-                pairing['white_rating'] = white.get('rating')
-        if 'black_name' not in pairing and 'black_player_id' in pairing and pairing['black_player_id']:
-            black = db.get_player(pairing['black_player_id'])
-            if black:
-                pairing['black_name'] = black.get('name', 'Unknown')
-                pairing['black_rating'] = black.get('rating')
-    
     # Check if this is a print view
     print_view = request.args.get('print') == '1'
     
@@ -1881,55 +1866,56 @@ def view_round(round_id):
 def conclude_tournament(tournament_id):
     """Conclude a tournament and freeze all data."""
     db = get_db()
-    tournament = db.get_tournament(tournament_id)
+    tournament = cached_tournament(tournament_id)
     
     # Check if tournament exists and user is the creator
     if not tournament:
         flash('Tournament not found.', 'danger')
         return redirect(url_for('tournament.index'))
         
-    if tournament['creator_id'] != session.get('user_id'):
+    if tournament['creator_id'] != g.user_id:
         flash('You do not have permission to conclude this tournament.', 'danger')
         return redirect(url_for('tournament.view', tournament_id=tournament_id))
     
     try:
-        # Start transaction
-        db.conn.execute('BEGIN TRANSACTION')
-        
-        # 1. Mark all incomplete rounds as completed
-        db.cursor.execute("""
-            UPDATE rounds 
-            SET status = 'completed', 
-                end_time = datetime('now')
-            WHERE tournament_id = ? 
-            AND status != 'completed'
-        """, (tournament_id,))
-        
-        # 2. Update all pending pairings to draw if they don't have a result
-        db.cursor.execute("""
-            UPDATE pairings 
-            SET status = 'completed',
-                result = '0.5-0.5'
-            WHERE status = 'pending'
-            AND round_id IN (SELECT id FROM rounds WHERE tournament_id = ?)
-            AND result IS NULL
-        """, (tournament_id,))
-        
-        # 3. Update tournament status to completed
-        db.cursor.execute("""
-            UPDATE tournaments 
-            SET status = 'completed',
-                end_date = date('now')
-            WHERE id = ?
-        """, (tournament_id,))
-        
-        # Commit all changes
-        db.conn.commit()
+        with _write_lock:
+            # Start transaction, taking the write lock up front
+            db.cursor.execute('BEGIN IMMEDIATE')
+            
+            # 1. Mark all incomplete rounds as completed
+            db.cursor.execute("""
+                UPDATE rounds 
+                SET status = 'completed', 
+                    end_time = datetime('now')
+                WHERE tournament_id = ? 
+                AND status != 'completed'
+            """, (tournament_id,))
+            
+            # 2. Update all pending pairings to draw if they don't have a result
+            db.cursor.execute("""
+                UPDATE pairings 
+                SET status = 'completed',
+                    result = '0.5-0.5'
+                WHERE status = 'pending'
+                AND round_id IN (SELECT id FROM rounds WHERE tournament_id = ?)
+                AND result IS NULL
+            """, (tournament_id,))
+            
+            # 3. Update tournament status to completed
+            db.cursor.execute("""
+                UPDATE tournaments 
+                SET status = 'completed',
+                    end_date = date('now')
+                WHERE id = ?
+            """, (tournament_id,))
+            
+            # Commit all changes
+            db.conn.commit()
         flash('Tournament has been concluded successfully! All rounds are now finalized.', 'success')
         
-    except Exception as e:
+    except Exception:
         db.conn.rollback()
-        print(f"Error concluding tournament: {e}")
+        current_app.logger.exception("Error concluding tournament")
         flash('Failed to conclude tournament. Please try again.', 'danger')
     
     return redirect(url_for('tournament.view', tournament_id=tournament_id))
@@ -1939,14 +1925,14 @@ def conclude_tournament(tournament_id):
 def delete_tournament(tournament_id):
     """Delete a tournament and all its data."""
     db = get_db()
-    user_id = session.get('user_id')
+    user_id = g.user_id
     
     if not user_id:
         flash('You must be logged in to delete a tournament.', 'error')
         return redirect(url_for('auth.login'))
     
     # Get the tournament to verify it exists and get creator_id
-    tournament = db.get_tournament(tournament_id)
+    tournament = cached_tournament(tournament_id)
     if not tournament:
         flash('Tournament not found.', 'error')
         return redirect(url_for('tournament.index'))
@@ -1969,7 +1955,7 @@ def delete_tournament(tournament_id):
 def mass_delete_tournaments():
     """Delete multiple tournaments at once."""
     db = get_db()
-    user_id = session.get('user_id')
+    user_id = g.user_id
     
     if not user_id:
         return jsonify({'success': False, 'message': 'Authentication required'}), 401
@@ -1981,41 +1967,13 @@ def mass_delete_tournaments():
         if not tournament_ids:
             return jsonify({'success': False, 'message': 'No tournaments selected'}), 400
         
-        success_count = 0
-        failed_count = 0
-        failed_ids = []
-        
-        for tournament_id in tournament_ids:
-            try:
-                # Verify the tournament exists and belongs to the user
-                tournament = db.get_tournament(tournament_id)
-                if not tournament:
-                    failed_count += 1
-                    failed_ids.append(tournament_id)
-                    continue
-                    
-                if tournament['creator_id'] != user_id:
-                    failed_count += 1
-                    failed_ids.append(tournament_id)
-                    continue
-                    
-                # Delete the tournament
-                if db.delete_tournament(tournament_id, user_id):
-                    success_count += 1
-                else:
-                    failed_count += 1
-                    failed_ids.append(tournament_id)
-                    
-            except sqlite3.IntegrityError as e:
-                print(f"Integrity error deleting tournament {tournament_id}: {e}")
-                failed_count += 1
-                failed_ids.append(tournament_id)
-                continue
-            except Exception as e:
-                print(f"Error deleting tournament {tournament_id}: {e}")
-                failed_count += 1
-                failed_ids.append(tournament_id)
-                continue
+        # Delete every tournament the user owns in one transaction; the rest
+        # (missing or someone else's) are reported back as failed. The
+        # dashboard may send the IDs as strings.
+        deleted_ids = {str(tid) for tid in db.delete_tournaments(tournament_ids, user_id)}
+        failed_ids = [tid for tid in tournament_ids if str(tid) not in deleted_ids]
+        failed_count = len(failed_ids)
+        success_count = len(tournament_ids) - failed_count
         
         if success_count > 0 and failed_count == 0:
             return jsonify({
@@ -2041,7 +1999,6 @@ def mass_delete_tournaments():
             }), 400
             
     except Exception as e:
-        import traceback
         current_app.logger.error(f'Error in mass_delete_tournaments: {str(e)}\n{traceback.format_exc()}')
         return jsonify({
             'success': False,
@@ -2061,6 +2018,106 @@ def teardown_request(exception=None):
     if db is not None:
         db.close()
 
+# Rows written per chunk of a streamed CSV response
+CSV_CHUNK_ROWS = 500
+
+def _stream_pairings_with_names(db_path, tournament_id):
+    """Yield a tournament's export rows from a connection of their own.
+    
+    Teardown closes the request's g.db before a streamed response has been
+    read to the end, so the rows cannot come from that connection.
+    """
+    db = TournamentDB(db_path)
+    try:
+        yield from db.iter_all_pairings_with_names(tournament_id)
+    finally:
+        db.close()
+
+def _csv_response(header, rows, filename):
+    """Stream rows as a CSV attachment, in chunks of CSV_CHUNK_ROWS, instead of building the file in memory."""
+    def generate():
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(header)
+        remaining = iter(rows)
+        while True:
+            chunk = list(islice(remaining, CSV_CHUNK_ROWS))
+            writer.writerows(chunk)
+            yield buffer.getvalue()
+            if len(chunk) < CSV_CHUNK_ROWS:
+                break
+            buffer.seek(0)
+            buffer.truncate()
+    
+    response = Response(stream_with_context(generate()), mimetype='text/csv')
+    try:
+        filename.encode('ascii')
+        response.headers.set('Content-Disposition', 'attachment', filename=filename)
+    except UnicodeEncodeError:
+        response.headers.set('Content-Disposition', 'attachment', **{'filename*': f"UTF-8''{quote(filename)}"})
+    return response
+
+# Columnar export formats, written by pandas through pyarrow
+ARROW_EXPORT_MIMETYPES = {
+    'parquet': 'application/vnd.apache.parquet',
+    'feather': 'application/vnd.apache.arrow.file',
+}
+
+def _arrow_response(df, export_format, filename, fallback_url):
+    """Send a DataFrame as a zstd-compressed Parquet or a Feather attachment.
+    
+    pyarrow is optional; without it the user is sent back to fallback_url.
+    """
+    output = io.BytesIO()
+    try:
+        if export_format == 'parquet':
+            df.to_parquet(output, engine='pyarrow', compression='zstd', index=False)
+        else:
+            df.to_feather(output)
+    except ImportError:
+        flash('Parquet and Feather exports require pyarrow to be installed.', 'danger')
+        return redirect(fallback_url)
+    output.seek(0)
+    
+    return send_file(
+        output,
+        mimetype=ARROW_EXPORT_MIMETYPES[export_format],
+        as_attachment=True,
+        download_name=f"{filename}.{export_format}"
+    )
+
+def _xlsx_response(header, rows, filename, sheet_name, autofit=False):
+    """Send rows as an xlsx attachment written in xlsxwriter's constant_memory mode.
+    
+    Each row is flushed as soon as it is written, so the worksheet is never
+    held in memory as a cell tree. With autofit, column widths are measured
+    while the rows are written; xlsxwriter keeps column settings apart from
+    the flushed cells, so they can still be applied afterwards.
+    """
+    import xlsxwriter
+    
+    output = io.BytesIO()
+    workbook = xlsxwriter.Workbook(output, {'constant_memory': True, 'strings_to_urls': False})
+    worksheet = workbook.add_worksheet(sheet_name)
+    worksheet.write_row(0, 0, header, workbook.add_format({'bold': True, 'border': 1}))
+    widths = [len(str(value)) for value in header]
+    for row_num, row in enumerate(rows, start=1):
+        worksheet.write_row(row_num, 0, row)
+        if autofit:
+            widths = [max(width, len(str(value))) for width, value in zip(widths, row)]
+    if autofit:
+        for i, width in enumerate(widths):
+            worksheet.set_column(i, i, width + 2)
+    workbook.close()
+    output.seek(0)
+    
+    return send_file(
+        output,
+        mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+        as_attachment=True,
+        download_name=filename
+    )
+
 @tournament_bp.route('/<int:tournament_id>/export-pairings/<int:round_id>/<format>')
 @login_required
 def export_pairings(tournament_id, round_id, format):
@@ -2069,7 +2126,7 @@ def export_pairings(tournament_id, round_id, format):
         db = get_db()
         
         # Get tournament and round information
-        tournament = db.get_tournament(tournament_id)
+        tournament = cached_tournament(tournament_id)
         if not tournament:
             flash('Tournament not found.', 'danger')
             return redirect(url_for('tournament.index'))
@@ -2092,15 +2149,13 @@ def export_pairings(tournament_id, round_id, format):
                 'result': p.get('result', '')
             })
         
-        # Create a DataFrame
-        import pandas as pd
-        from io import BytesIO
-        
-        df = pd.DataFrame(pairings_data)
-        
         # Create output based on format
         if format.lower() == 'xlsx':
-            output = BytesIO()
+            # pandas is only needed for Excel output
+            pd = _pandas()
+            
+            df = pd.DataFrame(pairings_data)
+            output = io.BytesIO()
             
             # Create a simple Excel file with just the data
             with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
@@ -2149,14 +2204,10 @@ def export_pairings(tournament_id, round_id, format):
             response.call_on_close(output.close)
             return response
         else:  # Default to CSV
-            output = BytesIO()
-            df.to_csv(output, index=False)
-            output.seek(0)
-            return send_file(
-                output,
-                mimetype='text/csv',
-                as_attachment=True,
-                download_name=f"{tournament['name'].replace(' ', '_')}_Round_{pairings[0].get('round_number', '')}_Pairings.csv"
+            return _csv_response(
+                list(pairings_data[0]),
+                (row.values() for row in pairings_data),
+                f"{tournament['name'].replace(' ', '_')}_Round_{pairings[0].get('round_number', '')}_Pairings.csv"
             )
             
     except Exception as e:
@@ -2164,6 +2215,9 @@ def export_pairings(tournament_id, round_id, format):
         flash(f'Error exporting pairings: {str(e)}', 'error')
         return redirect(url_for('tournament.manage_pairings', tournament_id=tournament_id))
 
+# Spreadsheet columns read by import_players (matched case-insensitively)
+IMPORT_COLUMNS = {'name', 'rating', 'team'}
+
 def allowed_file(filename):
     return '.' in filename and \
            filename.rsplit('.', 1)[1].lower() in {'xlsx', 'xls', 'csv'}
@@ -2188,25 +2242,25 @@ def batch_assign_byes(tournament_id, round_id):
         round_number = current_round['round_number']
         
         try:
-            # Use a savepoint for the byes update
-            db.cursor.execute('SAVEPOINT before_byes')
-            
-            # Clear existing manual byes for this round
-            db.cursor.execute(
-                "DELETE FROM manual_byes WHERE tournament_id = ? AND round_number = ?",
-                (tournament_id, round_number)
-            )
-            
-            # Add new manual byes
-            for player_id in player_ids:
+            with _write_lock:
+                # Use a savepoint for the byes update
+                db.cursor.execute('SAVEPOINT before_byes')
+                
+                # Clear existing manual byes for this round
                 db.cursor.execute(
+                    "DELETE FROM manual_byes WHERE tournament_id = ? AND round_number = ?",
+                    (tournament_id, round_number)
+                )
+                
+                # Add new manual byes
+                db.cursor.executemany(
                     """INSERT INTO manual_byes (tournament_id, player_id, round_number, created_by)
                     VALUES (?, ?, ?, ?)""",
-                    (tournament_id, player_id, round_number, session['user_id'])
+                    [(tournament_id, player_id, round_number, session['user_id']) for player_id in player_ids]
                 )
-            
-            # Commit the byes first
-            db.conn.commit()
+                
+                # Commit the byes first
+                db.conn.commit()
             
             # Now generate pairings - it will handle its own transaction
             success = db.generate_pairings(tournament_id, round_id, 'swiss')
@@ -2246,143 +2300,79 @@ def batch_assign_byes(tournament_id, round_id):
 def export_players(tournament_id):
     """Export players to a CSV or Excel file."""
     db = get_db()
-    tournament = db.get_tournament(tournament_id)
+    tournament = cached_tournament(tournament_id)
     if not tournament:
         flash('Tournament not found.', 'danger')
         return redirect(url_for('tournament.index'))
     
     # Get players with their team information
     players = db.get_players(tournament_id)
+    columns = ['Name', 'Team', 'Rating', 'Federation']
+    filename = f"{tournament['name'].replace(' ', '_')}_players"
     
-    # Convert to DataFrame
-    import pandas as pd
-    from io import BytesIO
-    
-    # Create a DataFrame with the required columns
-    data = []
-    for player in players:
-        data.append({
-            'Name': player['name'],
-            'Team': player.get('team', ''),
-            'Rating': player['rating'],
-            'Federation': player.get('federation', '')
-        })
-    
-    df = pd.DataFrame(data)
-    
-    # Create output
-    output = BytesIO()
+    rows = [(player['name'], player.get('team', ''), player['rating'], player.get('federation', ''))
+            for player in players]
     
     # Get the requested format (default to CSV)
     export_format = request.args.get('format', 'csv').lower()
     
     if export_format == 'xlsx':
-        # Export to Excel
-        with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-            df.to_excel(writer, index=False, sheet_name='Players')
-        mimetype = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-        extension = 'xlsx'
-    else:
-        # Default to CSV
-        output = BytesIO()
-        df.to_csv(output, index=False)
-        mimetype = 'text/csv'
-        extension = 'csv'
+        return _xlsx_response(columns, rows, f"{filename}.xlsx", 'Players')
+    if export_format not in ARROW_EXPORT_MIMETYPES:
+        # Default to CSV, streamed straight from the player rows
+        return _csv_response(columns, rows, f"{filename}.csv")
     
-    output.seek(0)
+    # pandas is only needed for columnar output
+    pd = _pandas()
     
-    return send_file(
-        output,
-        mimetype=mimetype,
-        as_attachment=True,
-        download_name=f"{tournament['name'].replace(' ', '_')}_players.{extension}"
-    )
+    # Build the DataFrame from the row tuples with explicit columns
+    df = pd.DataFrame.from_records(rows, columns=columns)
+    
+    return _arrow_response(df, export_format, filename,
+                           url_for('tournament.manage_players', tournament_id=tournament_id))
 
 @tournament_bp.route('/<int:tournament_id>/export-results')
 @login_required
 def export_results(tournament_id):
     """Export all tournament results to a CSV or Excel file."""
     db = get_db()
-    tournament = db.get_tournament(tournament_id)
+    tournament = cached_tournament(tournament_id)
     if not tournament:
         flash('Tournament not found.', 'danger')
         return redirect(url_for('tournament.index'))
     
     try:
-        # Get all rounds and their pairings
-        rounds = db.get_rounds(tournament_id)
-        if not rounds:
-            flash('No rounds found for this tournament.', 'warning')
-            return redirect(url_for('tournament.view', tournament_id=tournament_id))
-            
-        all_pairings = []
-        
-        for round_obj in rounds:
-            pairings = db.get_pairings(round_obj['id'])
-            if not pairings:
-                continue
-                
-            for p in pairings:
-                # Get player names, handling byes
-                white_name = 'BYE'
-                black_name = 'BYE'
-                
-                if p.get('white_player_id'):
-                    white_player = db.get_player(p['white_player_id'])
-                    white_name = white_player['name'] if white_player else 'Unknown Player'
-                if p.get('black_player_id'):
-                    black_player = db.get_player(p['black_player_id'])
-                    black_name = black_player['name'] if black_player else 'Unknown Player'
-                
-                all_pairings.append({
-                    'Round': round_obj['round_number'],
-                    'Board': p.get('board_number', ''),
-                    'White Player': white_name,
-                    'Black Player': black_name,
-                    'Result': p.get('result', '')
-                })
-        
-        if not all_pairings:
+        # Read every pairing with player names from a single query
+        rows = db.iter_all_pairings_with_names(tournament_id)
+        first_row = next(rows, None)
+        if first_row is None:
             flash('No pairings found to export.', 'warning')
             return redirect(url_for('tournament.view', tournament_id=tournament_id))
+        rows = chain([first_row], rows)
         
-        # Convert to DataFrame
-        import pandas as pd
-        from io import BytesIO
-        
-        df = pd.DataFrame(all_pairings)
+        columns = ['Round', 'Board', 'White Player', 'Black Player', 'Result']
+        filename = f"{tournament['name'].replace(' ', '_')}_results"
         
         # Get the requested format (default to CSV)
         export_format = request.args.get('format', 'csv').lower()
-        output = BytesIO()
         
         if export_format == 'xlsx':
-            # Export to Excel
-            with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-                df.to_excel(writer, index=False, sheet_name='Results')
-                
-                # Auto-adjust column widths
-                worksheet = writer.sheets['Results']
-                for i, col in enumerate(df.columns):
-                    max_length = max(df[col].astype(str).apply(len).max(), len(col)) + 2
-                    worksheet.set_column(i, i, max_length)
-                    
-            mimetype = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-            extension = 'xlsx'
-        else:
-            # Default to CSV
-            df.to_csv(output, index=False)
-            mimetype = 'text/csv'
-            extension = 'csv'
-        
-        output.seek(0)
-        
-        return send_file(
-            output,
-            mimetype=mimetype,
-            as_attachment=True,
-            download_name=f"{tournament['name'].replace(' ', '_')}_results.{extension}"
-        )
+            return _xlsx_response(columns, rows, f"{filename}.xlsx", 'Results', autofit=True)
+        if export_format not in ARROW_EXPORT_MIMETYPES:
+            # Default to CSV, streamed straight from the pairing rows
+            return _csv_response(columns, _stream_pairings_with_names(db.db_path, tournament_id),
+                                 f"{filename}.csv")
+        
+        # pandas is only needed for columnar output
+        pd = _pandas()
+        
+        # from_records splits the rows into per-dtype column blocks, so the
+        # columnar writers read each column from contiguous memory without a
+        # row-major 2D array to transpose
+        df = pd.DataFrame.from_records([tuple(row) for row in rows], columns=columns)
+        
+        return _arrow_response(df, export_format, filename,
+                               url_for('tournament.view', tournament_id=tournament_id))
     
     except Exception as e:
         current_app.logger.error(f"Error exporting results: {str(e)}")
@@ -2394,7 +2384,7 @@ def export_results(tournament_id):
 def import_players(tournament_id):
     """Import players from a spreadsheet file."""
     db = get_db()
-    tournament = db.get_tournament(tournament_id)
+    tournament = cached_tournament(tournament_id)
     if not tournament:
         flash('Tournament not found.', 'danger')
         return redirect(url_for('tournament.index'))
@@ -2414,10 +2404,22 @@ def import_players(tournament_id):
 
     try:
         # Read the file into a pandas DataFrame
+        pd = _pandas()
+        
+        # Only parse the columns we import, and read them as text so the reader
+        # skips type inference; ratings are coerced below
+        def usecols(col):
+            return str(col).lower() in IMPORT_COLUMNS
+        
         if file.filename.lower().endswith(('.xlsx', '.xls')):
-            df = pd.read_excel(file)
+            try:
+                # python-calamine streams the sheet instead of building an openpyxl DOM
+                df = pd.read_excel(file, engine='calamine', usecols=usecols, dtype=str)
+            except ImportError:
+                file.seek(0)
+                df = pd.read_excel(file, usecols=usecols, dtype=str)
         else:  # CSV
-            df = pd.read_csv(file)
+            df = pd.read_csv(file, usecols=usecols, dtype=str)
         
         # Convert column names to lowercase for case-insensitive matching
         df.columns = [col.lower() for col in df.columns]
@@ -2427,39 +2429,37 @@ def import_players(tournament_id):
             flash('Spreadsheet must contain a "name" column', 'error')
             return redirect(url_for('tournament.manage_players', tournament_id=tournament_id))
         
-        # Process each row
-        success_count = 0
-        error_messages = []
-        
-        for _, row in df.iterrows():
-            try:
-                name = str(row['name']).strip()
-                if not name:
-                    error_messages.append(f'Skipped: Empty name in row {_ + 2}')
-                    continue
-                    
-                rating = int(row.get('rating', 1200))
-                team = str(row.get('team', '')).strip() or None
-                
-                # Create the new player with current timestamp and team
-                db.cursor.execute(
-                    "INSERT INTO players (name, rating, team, created_at) VALUES (?, ?, ?, datetime('now'))",
-                    (name, rating, team)
-                )
-                player_id = db.cursor.lastrowid
-                
-                # Add to tournament
-                if db.add_player_to_tournament(tournament_id, player_id):
-                    success_count += 1
-                else:
-                    error_messages.append(f'Player "{name}" already in tournament')
-                
-            except ValueError as e:
-                error_messages.append(f'Error in row {_ + 2}: {str(e)}')
-            except Exception as e:
-                error_messages.append(f'Error processing row {_ + 2}: {str(e)}')
-        
-        db.conn.commit()
+        # Clean and validate whole columns up front; the loop below only inserts
+        names = df['name'].fillna('').astype(str).str.strip()
+        if 'rating' in df.columns:
+            ratings = pd.to_numeric(df['rating'], errors='coerce')
+            # Ratings are whole numbers; reject fractional ones rather than truncating
+            bad_rating = (ratings.isna() & df['rating'].notna()) | (ratings.notna() & (ratings % 1 != 0))
+            ratings = ratings.where(~bad_rating).fillna(1200).astype(int)
+        else:
+            ratings = pd.Series(1200, index=df.index)
+            bad_rating = pd.Series(False, index=df.index)
+        if 'team' in df.columns:
+            teams = df['team'].fillna('').astype(str).str.strip()
+        else:
+            teams = pd.Series('', index=df.index)
+        
+        empty_name = names == ''
+        skipped = empty_name | bad_rating
+        # Number rows by position (the header is spreadsheet row 1), whatever the index holds
+        error_messages = [
+            f'Skipped: Empty name in row {row_number}' if is_empty else f'Error in row {row_number}: invalid rating'
+            for row_number, (is_skipped, is_empty) in enumerate(zip(skipped.tolist(), empty_name.tolist()), start=2)
+            if is_skipped
+        ]
+        
+        # Insert every valid row in one transaction
+        valid = ~skipped
+        rows = list(zip(names[valid].tolist(), ratings[valid].tolist(),
+                        [team or None for team in teams[valid].tolist()]))
+        success_count = db.add_players_to_tournament(tournament_id, rows)
+        if rows and not success_count:
+            error_messages.insert(0, 'The players could not be saved.')
         
         if success_count > 0:
             flash(f'Successfully imported {success_count} players!', 'success')